@@ -0,0 +1,168 @@
+"""Compact article records and their saved formats.
+
+Articles used to travel through the scanner as dicts with a dozen string
+keys, rebuilt from articles_data.json on every save. Article keeps the same
+fields in __slots__, interns the source name and homepage every record from
+a feed shares, works out its sort timestamp once, and caches its rendered
+card so unchanged cards are not re-rendered on every save.
+
+articles_data.json is still written for anything reading the article list,
+but the scanner loads a columnar binary copy (articles_data.bin) instead:
+one marshal'd list per field, with the repetitive source columns stored
+once per distinct value and the sort timestamps precomputed. Thumbnails are
+split into path columns and the few grouped stories' copies are stored
+sparsely, since rebuilding per-record dicts and lists is most of a load.
+"""
+import marshal
+import os
+import sys
+from datetime import datetime
+
+ARTICLE_FIELDS = (
+    'source', 'source_homepage', 'title', 'link', 'image_url', 'thumbnail',
+    'published_date', 'story_id', 'summary', 'chars', 'has_full_content',
+    'content_length', 'found_at', 'also_reported_by'
+)
+# Columns with few distinct values, stored as an index into a table of values
+DICTIONARY_FIELDS = ('source', 'source_homepage')
+# Columns of dicts or lists, which write_binary flattens
+FLATTENED_FIELDS = ('thumbnail', 'also_reported_by')
+
+BINARY_MAGIC = b'THFCART'
+BINARY_VERSION = 1
+
+def timestamp_for(published_date, found_at):
+    """Seconds since the epoch to order an article by: its publish date, else when it was found"""
+    if published_date:
+        try:
+            return datetime.strptime(published_date, '%d %B %Y, %H:%M').timestamp()
+        except (ValueError, OverflowError, OSError):
+            pass
+    if found_at:
+        try:
+            return datetime.fromisoformat(found_at.replace('T', ' ').replace('Z', '')).timestamp()
+        except (ValueError, OverflowError, OSError):
+            pass
+    return float('-inf')
+
+class Article:
+    __slots__ = ARTICLE_FIELDS + ('sort_timestamp', 'card_key', 'card_html')
+
+    def __init__(self, source, source_homepage='#', title='', link='', image_url=None, thumbnail=None,
+                 published_date=None, story_id=None, summary='', chars=None, has_full_content=False,
+                 content_length=0, found_at=None, also_reported_by=None, sort_timestamp=None):
+        self.source = sys.intern(source)
+        self.source_homepage = sys.intern(source_homepage or '#')
+        self.title = title
+        self.link = link
+        self.image_url = image_url
+        self.thumbnail = thumbnail
+        self.published_date = published_date
+        self.story_id = story_id
+        self.summary = summary
+        self.chars = len(summary) if chars is None else chars
+        self.has_full_content = has_full_content
+        self.content_length = content_length
+        self.found_at = found_at
+        # Syndicated copies grouped under this card, as {'source', 'link'} dicts. A
+        # tuple, so the many articles without copies share the empty one.
+        self.also_reported_by = tuple(also_reported_by) if also_reported_by else ()
+        if sort_timestamp is None:
+            sort_timestamp = timestamp_for(published_date, found_at)
+        self.sort_timestamp = sort_timestamp
+        # render_article_card's cache: the inputs it rendered with and the result
+        self.card_key = None
+        self.card_html = None
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{field: data[field] for field in ARTICLE_FIELDS if field in data})
+
+    def to_dict(self):
+        data = {field: getattr(self, field) for field in ARTICLE_FIELDS}
+        # Only grouped stories carried this key in the dict format
+        if self.also_reported_by:
+            data['also_reported_by'] = list(self.also_reported_by)
+        else:
+            del data['also_reported_by']
+        return data
+
+    def add_copy(self, copy):
+        """Group a syndicated copy under this article's card"""
+        self.also_reported_by += (copy,)
+        self.card_key = self.card_html = None
+
+    def __repr__(self):
+        return f'Article({self.source!r}, {self.title[:40]!r})'
+
+def write_binary(articles, filename):
+    columns = {}
+    tables = {}
+    for field in ARTICLE_FIELDS:
+        if field in FLATTENED_FIELDS:
+            continue
+        values = [getattr(article, field) for article in articles]
+        if field in DICTIONARY_FIELDS:
+            table = list(dict.fromkeys(values))
+            positions = {value: i for i, value in enumerate(table)}
+            tables[field] = table
+            values = [positions[value] for value in values]
+        columns[field] = values
+    columns['sort_timestamp'] = [article.sort_timestamp for article in articles]
+    thumbnails = [article.thumbnail or {} for article in articles]
+    columns['thumbnail_jpeg'] = [thumbnail.get('jpeg') for thumbnail in thumbnails]
+    columns['thumbnail_webp'] = [thumbnail.get('webp') for thumbnail in thumbnails]
+    # Row number -> copies, for the articles that have any
+    columns['also_reported_by'] = {
+        i: article.also_reported_by for i, article in enumerate(articles) if article.also_reported_by
+    }
+
+    payload = marshal.dumps({'count': len(articles), 'tables': tables, 'columns': columns})
+    # Written aside and renamed, so a crash never leaves a truncated file to load
+    temp_filename = filename + '.tmp'
+    with open(temp_filename, 'wb') as f:
+        f.write(BINARY_MAGIC + bytes([BINARY_VERSION]) + payload)
+    os.replace(temp_filename, filename)
+
+def read_binary(filename):
+    """Articles from a file written by write_binary, or None if it is missing or unreadable.
+
+    None covers a file that is truncated or is missing a column too, so the
+    caller falls back to articles_data.json instead of failing to start.
+    """
+    try:
+        with open(filename, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    header = len(BINARY_MAGIC) + 1
+    if data[:header] != BINARY_MAGIC + bytes([BINARY_VERSION]):
+        return None
+    try:
+        saved = marshal.loads(data[header:])
+    except (ValueError, EOFError, TypeError):
+        return None
+
+    try:
+        return decode_columns(saved)
+    except (KeyError, ValueError, IndexError, TypeError, AttributeError):
+        return None
+
+def decode_columns(saved):
+    count = saved['count']
+    columns = saved['columns']
+    for field, table in saved['tables'].items():
+        columns[field] = [table[i] for i in columns[field]]
+    columns['thumbnail'] = [
+        {'jpeg': jpeg, 'webp': webp} if jpeg else None
+        for jpeg, webp in zip(columns['thumbnail_jpeg'], columns['thumbnail_webp'])
+    ]
+    copies = columns['also_reported_by']
+    columns['also_reported_by'] = [copies.get(i) for i in range(count)]
+    fields = ARTICLE_FIELDS + ('sort_timestamp',)
+    # zip would quietly drop the rows past the end of a short column
+    for field in fields:
+        if len(columns[field]) != count:
+            raise ValueError(f'column {field} has {len(columns[field])} rows, expected {count}')
+    rows = zip(*(columns[field] for field in fields))
+    return [Article(*row) for row in rows]
@@ -0,0 +1,622 @@
+"""Offline benchmark suite for the scanner.
+
+Records every feed, the relevant article pages and their lead images into a
+fixture directory once, then replays them from a local HTTP server so the
+full TottenhamAIScanner cycle and each stage in isolation can be timed
+without touching the 11 live sites.
+
+    python benchmark.py record fixtures/
+    python benchmark.py run fixtures/
+    python benchmark.py run fixtures/ --scale 2000 --save-baseline bench_baseline.json
+    python benchmark.py run fixtures/ --baseline bench_baseline.json
+    python benchmark.py search --documents 100000
+    python benchmark.py articles --count 100000
+
+--scale clones feed items (with unique links) until every feed carries that
+many, to see how each stage behaves with thousands of items. Results report
+throughput, per-call latency percentiles and peak traced memory, and are
+compared against a stored baseline when one is given.
+
+search needs no fixtures: it indexes that many synthetic articles into a
+fresh full-text index and times building it and querying it. articles
+compares memory per record and load/save time of the saved article list as
+JSON dicts and as Article records in the columnar binary file.
+"""
+import argparse
+import contextlib
+import hashlib
+import html
+import itertools
+import json
+import os
+import posixpath
+import random
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import requests
+
+from article import Article, read_binary, write_binary
+from metrics import METRICS
+from search_index import DEFAULT_LIMIT as DEFAULT_SEARCH_LIMIT, SearchIndex
+from tottenham_scanner import TottenhamAIScanner, create_smart_summary, parse_rss_date, strip_html
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+REGRESSION_TOLERANCE = 0.10
+
+def fixture_key(url):
+    return hashlib.sha1(url.encode()).hexdigest()[:16]
+
+@contextlib.contextmanager
+def scratch_scanner():
+    """A scanner working in its own temporary directory, so runs start clean"""
+    previous = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix='tottenham-bench-')
+    os.chdir(workdir)
+    try:
+        scanner = TottenhamAIScanner()
+        scanner.initial_request_delay = 0
+        scanner.request_delay = 0
+        yield scanner
+    finally:
+        os.chdir(previous)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+class Fixtures:
+    def __init__(self, directory):
+        self.directory = directory
+        self.manifest_file = os.path.join(directory, 'manifest.json')
+        if os.path.exists(self.manifest_file):
+            with open(self.manifest_file, 'r') as f:
+                self.manifest = json.load(f)
+        else:
+            self.manifest = {'feeds': {}, 'articles': {}, 'images': {}, 'content_types': {}}
+
+    def save(self):
+        with open(self.manifest_file, 'w') as f:
+            json.dump(self.manifest, f, indent=2)
+
+    def body_path(self, key):
+        return os.path.join(self.directory, 'bodies', key)
+
+    def read(self, key):
+        with open(self.body_path(key), 'rb') as f:
+            return f.read()
+
+    def store(self, url, response):
+        key = fixture_key(url)
+        os.makedirs(os.path.join(self.directory, 'bodies'), exist_ok=True)
+        with open(self.body_path(key), 'wb') as f:
+            f.write(response.content)
+        self.manifest['content_types'][key] = response.headers.get('Content-Type', 'application/octet-stream')
+        return key
+
+def record(directory):
+    fixtures = Fixtures(directory)
+    session = requests.Session()
+    session.headers['User-Agent'] = USER_AGENT
+
+    with scratch_scanner() as scanner:
+        for source_name, source_info in scanner.feeds.items():
+            print('🔍 Recording ' + source_name)
+            try:
+                response = session.get(source_info['url'], timeout=15)
+                response.raise_for_status()
+                root = ET.fromstring(response.content)
+            except Exception as e:
+                print('   ❌ Error: ' + str(e))
+                continue
+            fixtures.manifest['feeds'][source_name] = {
+                'url': source_info['url'],
+                'homepage': source_info['homepage'],
+                'key': fixtures.store(source_info['url'], response)
+            }
+
+            for item in root.findall('.//item')[:scanner.initial_items_to_check]:
+                title = item.findtext('title') or ''
+                link = item.findtext('link') or ''
+                desc_text = strip_html(item.findtext('description') or '')
+                if not link or not title or link in fixtures.manifest['articles']:
+                    continue
+                if not scanner.is_primary_tottenham_story(title, desc_text, "", source_name):
+                    continue
+
+                try:
+                    response = session.get(link, timeout=15)
+                    response.raise_for_status()
+                except Exception as e:
+                    print('   ⚠️  ' + link[:60] + ': ' + str(e))
+                    continue
+                key = fixtures.store(link, response)
+                _, image_url = scanner.parse_article_html(response.content, link)
+                fixtures.manifest['articles'][link] = {'key': key, 'image': image_url}
+                print('   📄 ' + title[:50])
+
+                if image_url and image_url not in fixtures.manifest['images']:
+                    try:
+                        response = session.get(image_url, timeout=15)
+                        response.raise_for_status()
+                        fixtures.manifest['images'][image_url] = fixtures.store(image_url, response)
+                    except Exception as e:
+                        print('   ⚠️  Image: ' + str(e))
+
+    fixtures.save()
+    print(f'💾 {len(fixtures.manifest["feeds"])} feeds, {len(fixtures.manifest["articles"])} articles, '
+          f'{len(fixtures.manifest["images"])} images in {directory}')
+
+class FixtureServer:
+    """Local stand-in for the live sites, serving recorded fixtures.
+
+    Feed item links and article image URLs are rewritten to point back at
+    this server. With items_per_feed set, feed items are cloned (unique
+    links, same article page) until every feed has that many.
+    """
+
+    def __init__(self, fixtures, items_per_feed=None):
+        self.fixtures = fixtures
+        self.items_per_feed = items_per_feed
+        self.bodies = {}
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), self.make_handler())
+        self.base_url = 'http://127.0.0.1:%d' % self.httpd.server_address[1]
+        self.feed_urls = {}
+
+        for image_url, key in fixtures.manifest['images'].items():
+            self.bodies[key] = fixtures.read(key)
+        for link, article in fixtures.manifest['articles'].items():
+            self.bodies[article['key']] = self.rewrite_article(fixtures.read(article['key']), article['image'])
+        for source_name, feed in fixtures.manifest['feeds'].items():
+            self.bodies[feed['key']] = self.rewrite_feed(fixtures.read(feed['key']))
+            self.feed_urls[source_name] = self.url(feed['key'])
+
+    def url(self, key, original_url=None):
+        """Local URL for a recorded body, ending in the original's file name if given"""
+        url = self.base_url + '/r/' + key
+        # The scanner judges image URLs by their extension, so it has to survive the rewrite
+        basename = posixpath.basename(urlsplit(original_url).path) if original_url else ''
+        return url + '/' + basename if basename else url
+
+    def rewrite_article(self, body, image_url):
+        image_key = self.fixtures.manifest['images'].get(image_url)
+        if not image_key:
+            return body
+        local = self.url(image_key, image_url).encode()
+        for variant in {image_url, html.escape(image_url)}:
+            body = body.replace(variant.encode(), local)
+        return body
+
+    def rewrite_feed(self, body):
+        root = ET.fromstring(body)
+        articles = self.fixtures.manifest['articles']
+        for channel in root.iter('channel'):
+            items = channel.findall('item')
+            for item in items:
+                link = item.find('link')
+                if link is not None and link.text in articles:
+                    link.text = self.url(articles[link.text]['key'])
+
+            if self.items_per_feed and items:
+                for n in range(len(items), self.items_per_feed):
+                    original = items[n % len(items)]
+                    clone = ET.fromstring(ET.tostring(original))
+                    copy = str(n // len(items))
+                    link = clone.find('link')
+                    if link is not None and link.text:
+                        link.text += ('&' if '?' in link.text else '?') + 'copy=' + copy
+                    title = clone.find('title')
+                    if title is not None and title.text:
+                        title.text += ' #' + copy
+                    channel.append(clone)
+        return ET.tostring(root)
+
+    def make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parts = urlsplit(self.path).path.split('/')
+                key = parts[2] if len(parts) > 2 and parts[1] == 'r' else None
+                body = server.bodies.get(key)
+                if body is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', server.fixtures.manifest['content_types'].get(key, 'application/octet-stream'))
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        thread = threading.Thread(target=self.httpd.serve_forever)
+        thread.daemon = True
+        thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def measure(stage, func, inputs, after_timing=None):
+    """Time func over every input, then rerun it under tracemalloc for peak memory"""
+    latencies = []
+    start = time.perf_counter()
+    for args in inputs:
+        call_start = time.perf_counter()
+        func(*args)
+        latencies.append(time.perf_counter() - call_start)
+    total = time.perf_counter() - start
+    if after_timing:
+        after_timing()
+
+    tracemalloc.start()
+    for args in inputs:
+        func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return timing_result(stage, len(inputs), total, latencies, peak)
+
+def timing_result(stage, items, total, latencies, peak):
+    latencies = sorted(latencies)
+    return {
+        'stage': stage,
+        'items': items,
+        'seconds': total,
+        'throughput': items / total if total else 0.0,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'peak_kib': peak / 1024
+    }
+
+def feed_items(server):
+    items = []
+    for source_name, feed in server.fixtures.manifest['feeds'].items():
+        root = ET.fromstring(server.bodies[feed['key']])
+        for item in root.findall('.//item'):
+            items.append((source_name, item))
+    return items
+
+def run_stages(server, scanner):
+    items = feed_items(server)
+    results = []
+
+    dates = [(item.findtext('pubDate') or '',) for _, item in items]
+    results.append(measure('date_parsing', parse_rss_date, dates))
+
+    relevance_inputs = [
+        (item.findtext('title') or '', item.findtext('description') or '', source_name)
+        for source_name, item in items
+    ]
+    results.append(measure(
+        'relevance',
+        lambda title, desc, source: scanner.is_primary_tottenham_story(title, strip_html(desc), "", source),
+        relevance_inputs
+    ))
+
+    pages = [(server.bodies[article['key']], link) for link, article in server.fixtures.manifest['articles'].items()]
+    if pages and server.items_per_feed:
+        # Scaled runs parse each recorded page as often as its clones appear
+        pages = (pages * (len(items) // len(pages) + 1))[:len(items)]
+    results.append(measure('extraction', scanner.parse_article_html, pages))
+
+    texts = [('', scanner.parse_article_html(body, link)[0]) for body, link in pages]
+    results.append(measure('summary', create_smart_summary, texts))
+
+    cards = [Article(
+        source_name,
+        title=item.findtext('title') or '',
+        summary=strip_html(item.findtext('description') or '')[:380],
+        link=item.findtext('link') or '',
+        published_date=item.findtext('pubDate')
+    ) for source_name, item in items]
+
+    def render_uncached(cards):
+        for card in cards:
+            card.card_key = None
+        scanner.create_live_html(cards)
+
+    # Latencies are per full render; throughput is reported in cards
+    for stage, render_func in (('render', render_uncached), ('render_cached', scanner.create_live_html)):
+        render = measure(stage, render_func, [(cards,)] * 5)
+        render['items'] = len(cards) * 5
+        render['throughput'] = render['items'] / render['seconds'] if render['seconds'] else 0.0
+        results.append(render)
+    return results
+
+def one_cycle(server, scale):
+    """One check_for_articles + save_all_articles pass by a fresh scanner"""
+    with scratch_scanner() as scanner:
+        if scale:
+            scanner.initial_items_to_check = scale
+        scanner.feeds = {name: info for name, info in scanner.feeds.items() if name in server.feed_urls}
+        for source_name, info in scanner.feeds.items():
+            info['url'] = server.feed_urls[source_name]
+
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            new_articles = scanner.check_for_articles()
+            if new_articles:
+                scanner.save_all_articles(new_articles)
+
+def run_cycle(server, scale, cycles):
+    """Time full cycles, keeping METRICS from the untraced runs for the stage breakdown"""
+    METRICS.reset()
+    result = measure('full_cycle', one_cycle, [(server, scale)] * cycles, after_timing=print_cycle_stages)
+    result['items'] = len(feed_items(server)) * cycles
+    result['throughput'] = result['items'] / result['seconds'] if result['seconds'] else 0.0
+    return result
+
+def print_cycle_stages():
+    totals = {}
+    for (name, labels), histogram in METRICS.histograms.items():
+        if name == 'scanner_stage_seconds':
+            stage = dict(labels).get('stage')
+            count, seconds = totals.get(stage, (0, 0.0))
+            totals[stage] = (count + histogram.count, seconds + histogram.total)
+
+    print('\n⏱️  Stage totals across the full cycles (nested stages overlap):')
+    for stage, (count, seconds) in sorted(totals.items(), key=lambda pair: -pair[1][1]):
+        print(f'   {stage:<14}{count:>8} calls {seconds:>10.3f}s')
+
+def print_results(results, baseline):
+    print(f'\n{"stage":<14}{"items":>8}{"items/s":>12}{"p50 ms":>10}{"p95 ms":>10}{"p99 ms":>10}{"peak KiB":>11}  vs baseline')
+    regressions = []
+    for result in results:
+        comparison = ''
+        previous = baseline.get(result['stage']) if baseline else None
+        if previous and previous.get('throughput'):
+            change = result['throughput'] / previous['throughput'] - 1
+            comparison = f'{change:+.1%}'
+            if change < -REGRESSION_TOLERANCE:
+                comparison += ' ❌'
+                regressions.append(result['stage'])
+        print(f'{result["stage"]:<14}{result["items"]:>8}{result["throughput"]:>12.1f}'
+              f'{result["p50_ms"]:>10.3f}{result["p95_ms"]:>10.3f}{result["p99_ms"]:>10.3f}'
+              f'{result["peak_kib"]:>11.1f}  {comparison}')
+    return regressions
+
+def run(directory, scale, cycles, baseline_file, save_baseline_file):
+    fixtures = Fixtures(directory)
+    if not fixtures.manifest['feeds']:
+        raise SystemExit('No fixtures in ' + directory + ', run "python benchmark.py record" first')
+
+    server = FixtureServer(fixtures, items_per_feed=scale).start()
+    try:
+        with scratch_scanner() as scanner:
+            results = run_stages(server, scanner)
+        results.append(run_cycle(server, scale, cycles))
+    finally:
+        server.stop()
+    report(results, scale, baseline_file, save_baseline_file)
+
+def report(results, scale, baseline_file, save_baseline_file):
+    """Print results against the baseline, optionally save them, and fail on regressions"""
+    baseline = None
+    if baseline_file and os.path.exists(baseline_file):
+        with open(baseline_file, 'r') as f:
+            baseline = json.load(f).get('results', {})
+
+    regressions = print_results(results, baseline)
+
+    if save_baseline_file:
+        with open(save_baseline_file, 'w') as f:
+            json.dump({
+                'recorded_at': datetime.now().isoformat(),
+                'scale': scale,
+                'results': {result['stage']: result for result in results}
+            }, f, indent=2)
+        print('💾 Baseline saved to ' + save_baseline_file)
+
+    if regressions:
+        print(f'❌ Throughput regressed more than {REGRESSION_TOLERANCE:.0%}: ' + ', '.join(regressions))
+        raise SystemExit(1)
+
+SEARCH_PLAYERS = [
+    'kulusevski', 'maddison', 'son', 'romero', 'van de ven', 'vicario', 'solanke',
+    'bissouma', 'sarr', 'porro', 'udogie', 'johnson', 'bergvall', 'gray', 'richarlison'
+]
+SEARCH_WORDS = [
+    'transfer', 'rumour', 'injury', 'contract', 'loan', 'fee', 'bid', 'striker', 'midfielder',
+    'defender', 'goal', 'assist', 'manager', 'press', 'conference', 'training', 'squad',
+    'summer', 'window', 'deadline', 'medical', 'agreement', 'talks', 'interest', 'report'
+]
+SEARCH_BATCH = 1000
+
+def synthetic_search_corpus(documents, seed=42, vocabulary=5000, body_words=150):
+    """Article records with Zipf-distributed body text, generated batch by batch"""
+    rng = random.Random(seed)
+    words = SEARCH_WORDS + SEARCH_PLAYERS + [f'w{i}' for i in range(vocabulary)]
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(words))))
+    for start in range(0, documents, SEARCH_BATCH):
+        batch = []
+        for i in range(start, min(documents, start + SEARCH_BATCH)):
+            title = f'{rng.choice(SEARCH_PLAYERS).title()} {rng.choice(SEARCH_WORDS)} {rng.choice(SEARCH_WORDS)} update {i}'
+            body = ' '.join(rng.choices(words, cum_weights=cum_weights, k=body_words))
+            article = {
+                'link': f'https://example.com/news/{i}',
+                'title': title,
+                'source': f'Source {i % 50}',
+                'published_date': None,
+                'summary': body[:300],
+                'found_at': datetime.now().isoformat()
+            }
+            batch.append((article, body))
+        yield batch
+
+def search_queries(count, seed=7):
+    rng = random.Random(seed)
+    shapes = [
+        lambda: rng.choice(SEARCH_PLAYERS),
+        lambda: rng.choice(SEARCH_PLAYERS) + ' ' + rng.choice(SEARCH_WORDS),
+        lambda: ' '.join(rng.sample(SEARCH_WORDS, 3)),
+        lambda: f'w{rng.randrange(4000, 5000)}',
+        lambda: 'nosuchword' + str(rng.randrange(1000)),
+    ]
+    return [shapes[i % len(shapes)]() for i in range(count)]
+
+def run_search(documents, queries, baseline_file, save_baseline_file):
+    """Build a search index of synthetic articles and time queries against it"""
+    workdir = tempfile.mkdtemp(prefix='tottenham-search-')
+    try:
+        index = SearchIndex(os.path.join(workdir, 'search_index.db'))
+        latencies = []
+        for batch in synthetic_search_corpus(documents):
+            # Only indexing is timed, not generating the batch. SQLite's
+            # memory is invisible to tracemalloc, so no peak is reported.
+            batch_start = time.perf_counter()
+            index.add_many(batch)
+            latencies.append(time.perf_counter() - batch_start)
+        # Latencies are per batch of SEARCH_BATCH articles; throughput is in articles
+        results = [timing_result('search_build', documents, sum(latencies), latencies, 0)]
+
+        query_inputs = [(query,) for query in search_queries(queries)]
+        # As left by incremental adds, then merged into one segment
+        results.append(measure('search_query', index.search, query_inputs))
+        index.optimize()
+        results.append(measure('search_merged', index.search, query_inputs))
+        # BM25 scores every match, so fewer queries are timed
+        ranked_inputs = [(query, DEFAULT_SEARCH_LIMIT, 'relevance') for query, in query_inputs[:max(1, queries // 10)]]
+        results.append(measure('search_ranked', index.search, ranked_inputs))
+        index.close()
+        size = sum(os.path.getsize(os.path.join(workdir, name)) for name in os.listdir(workdir))
+        print(f'🔎 {documents} articles indexed, {size / 1024 / 1024:.1f} MiB on disk')
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    report(results, documents, baseline_file, save_baseline_file)
+
+ARTICLE_SOURCES = [
+    'Tottenham Official', 'TottenhamHotspurNews', 'SpursWeb', 'To The Lane And Back', 'Football.London',
+    'BBC Sport', 'Sky Sports', 'The Guardian', 'Evening Standard', 'Cartilage Free Captain', 'Spurs Odds'
+]
+
+def synthetic_articles(count, seed=42):
+    """Saved-article dicts shaped like the scanner's, in articles_data.json format"""
+    rng = random.Random(seed)
+    articles = []
+    for i in range(count):
+        source = rng.choice(ARTICLE_SOURCES)
+        summary = ' '.join(rng.choices(SEARCH_WORDS + SEARCH_PLAYERS, k=50))[:380]
+        key = fixture_key(str(i))
+        article = {
+            'source': source,
+            'source_homepage': 'https://' + source.lower().replace(' ', '') + '.example.com',
+            'title': f'{rng.choice(SEARCH_PLAYERS).title()} {rng.choice(SEARCH_WORDS)} {rng.choice(SEARCH_WORDS)} update {i}',
+            'link': f'https://example.com/news/{i}',
+            'image_url': f'https://example.com/images/{i}.jpg',
+            'thumbnail': {'jpeg': f'thumbnails/{key}.jpg', 'webp': f'thumbnails/{key}.webp'},
+            'published_date': datetime.fromtimestamp(1700000000 + i * 600).strftime('%d %B %Y, %H:%M'),
+            'story_id': key,
+            'summary': summary,
+            'chars': len(summary),
+            'has_full_content': True,
+            'content_length': rng.randrange(1000, 8000),
+            'found_at': datetime.fromtimestamp(1700000000 + i * 600).isoformat()
+        }
+        if i % 10 == 0:
+            article['also_reported_by'] = [{'source': rng.choice(ARTICLE_SOURCES), 'link': f'https://example.org/copy/{i}'}]
+        articles.append(article)
+    return articles
+
+def retained_bytes(load):
+    """Traced memory still held by what load() returns"""
+    tracemalloc.start()
+    loaded = load()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del loaded
+    return current
+
+def run_articles(count, baseline_file, save_baseline_file):
+    """Compare the saved article list as JSON dicts and as Article records in the binary file"""
+    workdir = tempfile.mkdtemp(prefix='tottenham-articles-')
+    try:
+        json_file = os.path.join(workdir, 'articles_data.json')
+        binary_file = os.path.join(workdir, 'articles_data.bin')
+        records = synthetic_articles(count)
+        articles = [Article.from_dict(record) for record in records]
+
+        def save_json(records):
+            with open(json_file, 'w') as f:
+                json.dump({'articles': records}, f, indent=2)
+
+        def load_json():
+            with open(json_file, 'r') as f:
+                return json.load(f)['articles']
+
+        # As the scanner used to save and load, then as it does now
+        results = [
+            measure('articles_save_json', save_json, [(records,)] * 3),
+            measure('articles_save_binary', write_binary, [(articles, binary_file)] * 3),
+            measure('articles_load_json', load_json, [()] * 3),
+            measure('articles_load_binary', read_binary, [(binary_file,)] * 3)
+        ]
+        for result in results:
+            # Latencies are per full file; throughput is reported in articles
+            result['items'] *= count
+            result['throughput'] = result['items'] / result['seconds'] if result['seconds'] else 0.0
+
+        del records, articles
+        dict_bytes = retained_bytes(load_json)
+        article_bytes = retained_bytes(lambda: read_binary(binary_file))
+        print(f'📦 {count} articles: JSON {os.path.getsize(json_file) / 1024 / 1024:.1f} MiB, '
+              f'binary {os.path.getsize(binary_file) / 1024 / 1024:.1f} MiB on disk')
+        print(f'🧮 Memory per article: {dict_bytes / count:.0f} bytes as dicts, '
+              f'{article_bytes / count:.0f} bytes as Article records')
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    report(results, count, baseline_file, save_baseline_file)
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline scanner benchmarks')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = subparsers.add_parser('record', help='record live feeds and articles as fixtures')
+    record_parser.add_argument('fixtures')
+
+    run_parser = subparsers.add_parser('run', help='replay fixtures and time the scanner')
+    run_parser.add_argument('fixtures')
+    run_parser.add_argument('--scale', type=int, default=None, help='clone feed items up to this many per feed')
+    run_parser.add_argument('--cycles', type=int, default=3, help='full scanner cycles to time')
+    run_parser.add_argument('--baseline', help='baseline JSON to compare against')
+    run_parser.add_argument('--save-baseline', help='write these results as a baseline JSON')
+
+    search_parser = subparsers.add_parser('search', help='time the full-text search index on synthetic articles')
+    search_parser.add_argument('--documents', type=int, default=100000, help='articles to index')
+    search_parser.add_argument('--queries', type=int, default=500, help='queries to time')
+    search_parser.add_argument('--baseline', help='baseline JSON to compare against')
+    search_parser.add_argument('--save-baseline', help='write these results as a baseline JSON')
+
+    articles_parser = subparsers.add_parser('articles', help='time loading and saving the article list')
+    articles_parser.add_argument('--count', type=int, default=100000, help='synthetic articles to save and load')
+    articles_parser.add_argument('--baseline', help='baseline JSON to compare against')
+    articles_parser.add_argument('--save-baseline', help='write these results as a baseline JSON')
+
+    args = parser.parse_args()
+    if args.command == 'record':
+        record(args.fixtures)
+    elif args.command == 'search':
+        run_search(args.documents, args.queries, args.baseline, args.save_baseline)
+    elif args.command == 'articles':
+        run_articles(args.count, args.baseline, args.save_baseline)
+    else:
+        run(args.fixtures, args.scale, args.cycles, args.baseline, args.save_baseline)
+
+if __name__ == '__main__':
+    main()
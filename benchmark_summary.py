@@ -0,0 +1,183 @@
+"""Micro-benchmark for TottenhamAIScanner.create_smart_summary.
+
+Runs the current summariser, its batch entry point and the original
+per-call regex implementation over a corpus of saved article texts, checks
+all three produce identical summaries and reports throughput.
+
+    python benchmark_summary.py saved_articles/          # *.txt, one article each
+    python benchmark_summary.py --synthetic 500
+"""
+import argparse
+import os
+import random
+import re
+import time
+
+from tottenham_scanner import create_smart_summary, create_smart_summaries
+
+
+def legacy_smart_summary(title, full_text, url):
+    """create_smart_summary as it was before the patterns were precompiled"""
+    if not full_text or len(full_text) < 200:
+        return "Read the full article for complete details on this Tottenham story."
+    
+    clean_text = re.sub(r'\s+', ' ', full_text).strip()
+    
+    cleanup_patterns = [
+        r'READ MORE:.*?(?=\.|$)',
+        r'CLICK HERE.*?(?=\.|$)',
+        r'Sign up.*?(?=\.|$)',
+        r'Subscribe.*?(?=\.|$)',
+    ]
+    
+    for pattern in cleanup_patterns:
+        clean_text = re.sub(pattern, '', clean_text, flags=re.IGNORECASE)
+    
+    sentences = re.split(r'(?<=[.!?])\s+(?=[A-Z])', clean_text)
+    sentences = [s.strip() for s in sentences if len(s.strip()) > 30 and len(s.strip()) < 300]
+    
+    if not sentences:
+        return "Read the full article for complete details on this Tottenham story."
+    
+    tottenham_keywords = ['tottenham', 'spurs', 'thfc', 'postecoglou', 'ange', 'levy', 'son', 'kane']
+    action_words = ['sign', 'buy', 'sell', 'target', 'win', 'lose', 'beat', 'defeat', 'transfer']
+    
+    scored_sentences = []
+    for i, sentence in enumerate(sentences[:15]):
+        score = 0
+        sentence_lower = sentence.lower()
+        
+        for keyword in tottenham_keywords:
+            score += sentence_lower.count(keyword) * 5
+        
+        for word in action_words:
+            if word in sentence_lower:
+                score += 3
+        
+        score += (15 - i) * 0.5
+        
+        if len(sentence) > 200:
+            score -= 2
+        
+        if score > 0:
+            scored_sentences.append((score, sentence, i))
+    
+    if not scored_sentences:
+        return "Read the full article for complete details on this Tottenham story."
+    
+    scored_sentences.sort(key=lambda x: -x[0])
+    
+    summary_parts = []
+    total_length = 0
+    target_length = 380
+    
+    for score, sentence, position in scored_sentences:
+        sentence_length = len(sentence)
+        
+        if total_length + sentence_length > target_length:
+            if total_length < 200:
+                remaining_space = target_length - total_length
+                if remaining_space > 50:
+                    truncated = sentence[:remaining_space].strip()
+                    last_space = truncated.rfind(' ')
+                    if last_space > remaining_space * 0.7:
+                        truncated = truncated[:last_space] + '...'
+                        summary_parts.append(truncated)
+                        break
+            else:
+                break
+        else:
+            summary_parts.append(sentence)
+            total_length += sentence_length
+            
+            if total_length >= 250:
+                break
+    
+    if not summary_parts:
+        for score, sentence, position in scored_sentences[:3]:
+            if len(sentence) <= 400:
+                return sentence
+        return "Read the full article for complete details on this Tottenham story."
+    
+    summary = ' '.join(summary_parts)
+    summary = re.sub(r'\s+', ' ', summary).strip()
+    
+    if summary and not summary.endswith(('.', '!', '?', '...')):
+        summary += '.'
+    
+    return summary if len(summary) > 50 else "Read the full article for complete details on this Tottenham story."
+
+
+def load_corpus(path):
+    corpus = []
+    for name in sorted(os.listdir(path)):
+        if name.endswith('.txt'):
+            with open(os.path.join(path, name), 'r', encoding='utf-8') as f:
+                corpus.append((name[:-4], f.read()))
+    return corpus
+
+
+def synthetic_corpus(count, seed=2025):
+    rng = random.Random(seed)
+    words = ('Tottenham Spurs Postecoglou Levy Son Kane Maddison Kulusevski Romero '
+             'the club boss striker midfielder season transfer target sign deal '
+             'defeat win Chelsea Arsenal READ MORE: Subscribe CLICK HERE Sign up '
+             'and with after before says ready new fee million').split()
+    corpus = []
+    for n in range(count):
+        sentences = []
+        for _ in range(rng.randint(10, 60)):
+            sentence = [rng.choice(words) for _ in range(rng.randint(4, 40))]
+            sentences.append(sentence[0].capitalize() + ' ' + ' '.join(sentence[1:]) +
+                             rng.choice(['.', '.', '!', '?']))
+        corpus.append(('synthetic-' + str(n), '\n  '.join(sentences)))
+    return corpus
+
+
+def time_summaries(summarise, corpus, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        outputs = [summarise(title, text, '') for title, text in corpus]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark create_smart_summary')
+    parser.add_argument('corpus', nargs='?', help='directory of saved article .txt files')
+    parser.add_argument('--synthetic', type=int, default=200, help='synthetic articles when no corpus is given')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--processes', type=int, default=None, help='batch pool size (default: all cores)')
+    args = parser.parse_args()
+    
+    corpus = load_corpus(args.corpus) if args.corpus else synthetic_corpus(args.synthetic)
+    if not corpus:
+        parser.error('no articles found')
+    
+    legacy_time, legacy_out = time_summaries(legacy_smart_summary, corpus, args.repeat)
+    current_time, current_out = time_summaries(
+        lambda title, text, url: create_smart_summary(title, text), corpus, args.repeat
+    )
+    
+    start = time.perf_counter()
+    batch_out = create_smart_summaries(corpus, args.processes)
+    batch_time = time.perf_counter() - start
+    
+    mismatches = [title for (title, _), a, b, c in zip(corpus, legacy_out, current_out, batch_out)
+                  if not a == b == c]
+    total_chars = sum(len(text) for _, text in corpus)
+    
+    print(f'📚 {len(corpus)} articles, {total_chars} chars')
+    print(f'🐢 legacy:  {len(corpus) / legacy_time:10.1f} articles/s')
+    print(f'🚀 current: {len(corpus) / current_time:10.1f} articles/s ({legacy_time / current_time:.2f}x)')
+    print(f'🏭 batch:   {len(corpus) / batch_time:10.1f} articles/s ({legacy_time / batch_time:.2f}x, incl. pool start-up)')
+    if mismatches:
+        print(f'❌ {len(mismatches)} summaries differ: ' + ', '.join(mismatches[:10]))
+        raise SystemExit(1)
+    print('✅ Identical output')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""Per-source health tracking and circuit breaker.
+
+A feed that is down or serving broken XML used to cost a full 15 second
+timeout every cycle. Each source now keeps its consecutive failures, an
+EWMA of feed fetch latency and its last success. After FAILURE_THRESHOLD
+failures in a row the circuit opens and the source is skipped for a
+cooldown that doubles with every further failure, up to MAX_COOLDOWN. When
+the cooldown ends a single probe is let through with a short timeout; a
+success closes the circuit, a failure reopens it for longer.
+
+Healthy sources get a timeout scaled from their own latency rather than a
+flat 15 seconds, so a site that hangs is given up on quickly. The state is
+saved to source_health.json, published as gauges in METRICS and shown in
+the page footer.
+"""
+import json
+import os
+import time
+
+from metrics import METRICS
+
+FAILURE_THRESHOLD = 3
+BASE_COOLDOWN = 120
+MAX_COOLDOWN = 3600
+EWMA_ALPHA = 0.3
+DEFAULT_TIMEOUT = 15
+MIN_TIMEOUT = 3
+PROBE_TIMEOUT = 5
+# Timeout as a multiple of a source's usual latency
+TIMEOUT_LATENCY_FACTOR = 4
+
+class HealthTracker:
+    def __init__(self, filename='source_health.json'):
+        self.filename = filename
+        # Source name -> state dict, see state()
+        self.sources = self.load()
+        for source_name in self.sources:
+            self.publish_metrics(source_name)
+
+    def load(self):
+        if os.path.exists(self.filename):
+            try:
+                with open(self.filename, 'r') as f:
+                    return json.load(f)
+            except:
+                return {}
+        return {}
+
+    def save(self):
+        with open(self.filename, 'w') as f:
+            json.dump(self.sources, f, indent=2)
+
+    def state(self, source_name):
+        return self.sources.setdefault(source_name, {
+            'consecutive_failures': 0,
+            'latency_ewma': None,
+            'last_success': None,
+            'last_failure': None,
+            'last_error': None,
+            'open_until': None
+        })
+
+    def is_open(self, source_name, now=None):
+        open_until = self.state(source_name)['open_until']
+        return open_until is not None and (now or time.time()) < open_until
+
+    def is_probe(self, source_name):
+        """Whether the next check is a probe of a source whose cooldown has ended"""
+        state = self.state(source_name)
+        return state['open_until'] is not None and not self.is_open(source_name)
+
+    def should_poll(self, source_name, now=None):
+        return not self.is_open(source_name, now)
+
+    def timeout(self, source_name):
+        """Feed fetch timeout in seconds for the source's next check"""
+        if self.is_probe(source_name):
+            return PROBE_TIMEOUT
+        latency = self.state(source_name)['latency_ewma']
+        if latency is None:
+            return DEFAULT_TIMEOUT
+        return min(DEFAULT_TIMEOUT, max(MIN_TIMEOUT, latency * TIMEOUT_LATENCY_FACTOR))
+
+    def record_success(self, source_name, latency):
+        state = self.state(source_name)
+        if state['latency_ewma'] is None:
+            state['latency_ewma'] = latency
+        else:
+            state['latency_ewma'] = EWMA_ALPHA * latency + (1 - EWMA_ALPHA) * state['latency_ewma']
+        if state['open_until'] is not None:
+            print(f'   💚 {source_name} recovered, circuit closed')
+        state.update({
+            'consecutive_failures': 0,
+            'last_success': time.time(),
+            'open_until': None
+        })
+        self.publish_metrics(source_name)
+
+    def record_failure(self, source_name, error):
+        state = self.state(source_name)
+        state['consecutive_failures'] += 1
+        state['last_failure'] = time.time()
+        state['last_error'] = str(error)[:200]
+        failures = state['consecutive_failures']
+        if failures >= FAILURE_THRESHOLD:
+            cooldown = min(MAX_COOLDOWN, BASE_COOLDOWN * 2 ** (failures - FAILURE_THRESHOLD))
+            state['open_until'] = state['last_failure'] + cooldown
+            print(f'   🔌 {source_name} failed {failures} times in a row, skipping for {cooldown}s')
+        self.publish_metrics(source_name)
+
+    def publish_metrics(self, source_name):
+        state = self.state(source_name)
+        METRICS.set_gauge('scanner_source_up', 0 if self.is_open(source_name) else 1, source=source_name)
+        METRICS.set_gauge('scanner_source_consecutive_failures', state['consecutive_failures'], source=source_name)
+        if state['latency_ewma'] is not None:
+            METRICS.set_gauge('scanner_source_latency_ewma_seconds', round(state['latency_ewma'], 4), source=source_name)
+        if state['last_success'] is not None:
+            METRICS.set_gauge('scanner_source_last_success_timestamp', round(state['last_success']), source=source_name)
+
+    def unhealthy(self, source_names):
+        """(source name, state) for sources currently failing, worst first"""
+        failing = [
+            (name, self.sources[name]) for name in source_names
+            if name in self.sources and self.sources[name]['consecutive_failures']
+        ]
+        return sorted(failing, key=lambda item: -item[1]['consecutive_failures'])
@@ -0,0 +1,239 @@
+"""Local thumbnail cache for article card images.
+
+Cards used to hotlink full-size og:images (often 1-3 MB) and show them
+180px tall. Each image is now downloaded once, checked to really be an
+image, shrunk to card size and written under a content-hashed name in
+THUMB_DIR, with a WebP copy when Pillow supports it. Content-hashed files
+never change, so the web server can let clients cache them for a year.
+The directory is kept under a disk quota by evicting the least recently
+used files.
+
+Several scanner processes can share one directory: each keeps its own
+index file, and only one of them should enforce the quota (the others pass
+quota_bytes=None), since evicting a file another process has just written
+would leave its card without an image.
+"""
+import hashlib
+import io
+import json
+import os
+import tempfile
+
+import requests
+
+from metrics import METRICS
+
+try:
+    from PIL import Image, features
+    # Pillow's word that the bytes are not a usable image, as opposed to a disk or file error
+    NOT_AN_IMAGE_ERRORS = (Image.UnidentifiedImageError, Image.DecompressionBombError)
+except ImportError:
+    Image = None
+    NOT_AN_IMAGE_ERRORS = ()
+
+THUMB_DIR = 'thumbs'
+# Twice the card's 180px display height, and wide enough for desktop cards
+THUMB_MAX_SIZE = (720, 480)
+JPEG_QUALITY = 80
+WEBP_QUALITY = 75
+MAX_DOWNLOAD_BYTES = 10 * 1024 * 1024
+DISK_QUOTA_BYTES = 200 * 1024 * 1024
+
+IMAGE_SIGNATURES = [
+    (b'\xff\xd8\xff', 'jpg'),
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+    (b'GIF87a', 'gif'),
+    (b'GIF89a', 'gif'),
+]
+
+def sniff_image_type(data):
+    """File extension for the image format in data, or None if it is not an image"""
+    for signature, extension in IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return extension
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'webp'
+    return None
+
+class ImageCache:
+    def __init__(self, directory=THUMB_DIR, quota_bytes=DISK_QUOTA_BYTES, index_name='index.json'):
+        self.directory = directory
+        # None leaves eviction to another process sharing the directory
+        self.quota_bytes = quota_bytes
+        self.index_file = os.path.join(directory, index_name)
+        self.can_resize = Image is not None
+        self.can_webp = self.can_resize and features.check('webp')
+
+        os.makedirs(directory, exist_ok=True)
+        index = self.load_index()
+        # Source URL -> {'jpeg': path, 'webp': path or None}
+        self.thumbnails = index.get('thumbnails', {})
+        # Source URLs that turned out not to be images
+        self.rejected = set(index.get('rejected', []))
+
+    def load_index(self):
+        if os.path.exists(self.index_file):
+            try:
+                with open(self.index_file, 'r') as f:
+                    return json.load(f)
+            except:
+                return {}
+        return {}
+
+    def save_index(self):
+        with open(self.index_file, 'w') as f:
+            json.dump({
+                'thumbnails': self.thumbnails,
+                'rejected': sorted(self.rejected)
+            }, f, indent=2)
+
+    def is_rejected(self, image_url):
+        return image_url in self.rejected
+
+    def thumbnail(self, image_url):
+        """Local thumbnail paths for image_url, downloading and resizing it on first use.
+
+        Returns None if the image could not be fetched or thumbnailed, or is
+        not an image; is_rejected() is only true for the last, so the card can
+        still hotlink the original otherwise.
+        """
+        if not image_url or image_url in self.rejected:
+            return None
+
+        cached = self.thumbnails.get(image_url)
+        if cached and all(os.path.exists(path) for path in cached.values() if path):
+            METRICS.cache_lookup('image', True)
+            self.touch(cached)
+            return cached
+
+        METRICS.cache_lookup('image', False)
+        data = self.download(image_url)
+        if data is None:
+            return None
+
+        extension = sniff_image_type(data)
+        if extension is None:
+            print('      ⚠️  Not an image: ' + image_url[:60])
+            self.rejected.add(image_url)
+            self.save_index()
+            return None
+
+        try:
+            thumbnail = self.write_thumbnails(data, extension)
+        except NOT_AN_IMAGE_ERRORS as e:
+            print('      ⚠️  Not a usable image: ' + str(e))
+            self.rejected.add(image_url)
+            self.save_index()
+            return None
+        except Exception as e:
+            # Disk full and the like: the original can still be shown, and a later cycle retries
+            print('      ⚠️  Thumbnail error: ' + str(e))
+            return None
+
+        self.thumbnails[image_url] = thumbnail
+        if self.quota_bytes is not None:
+            self.enforce_quota(keep=thumbnail.values())
+        self.save_index()
+        return thumbnail
+
+    def download(self, image_url):
+        try:
+            headers = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'}
+            with requests.get(image_url, headers=headers, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                chunks = []
+                size = 0
+                for chunk in response.iter_content(64 * 1024):
+                    size += len(chunk)
+                    if size > MAX_DOWNLOAD_BYTES:
+                        print('      ⚠️  Image too large: ' + image_url[:60])
+                        return None
+                    chunks.append(chunk)
+                METRICS.add_bytes(size, 'image')
+                return b''.join(chunks)
+        except Exception as e:
+            print('      ⚠️  Image download error: ' + str(e))
+            return None
+
+    def write_thumbnails(self, data, extension):
+        digest = hashlib.sha256(data).hexdigest()[:24]
+
+        if not self.can_resize:
+            # Without Pillow the original is still served locally, just not shrunk
+            path = os.path.join(self.directory, digest + '.' + extension)
+            if not os.path.exists(path):
+                self.write_file(path, lambda f: f.write(data))
+            return {'jpeg': path, 'webp': None}
+
+        jpeg_path = os.path.join(self.directory, digest + '.jpg')
+        webp_path = os.path.join(self.directory, digest + '.webp') if self.can_webp else None
+        if os.path.exists(jpeg_path) and (webp_path is None or os.path.exists(webp_path)):
+            return {'jpeg': jpeg_path, 'webp': webp_path}
+
+        image = Image.open(io.BytesIO(data))
+        image.draft('RGB', THUMB_MAX_SIZE)
+        if image.mode in ('RGBA', 'LA', 'P'):
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            image = background
+        elif image.mode != 'RGB':
+            image = image.convert('RGB')
+        image.thumbnail(THUMB_MAX_SIZE)
+
+        self.write_file(jpeg_path, lambda f: image.save(f, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True))
+        if webp_path:
+            self.write_file(webp_path, lambda f: image.save(f, 'WEBP', quality=WEBP_QUALITY))
+        return {'jpeg': jpeg_path, 'webp': webp_path}
+
+    def write_file(self, path, write):
+        """Write path through a temporary file of this writer's own, then rename it into place.
+
+        A process sharing the directory never serves half a file. Names are
+        content hashes, so if another process got there first its file has
+        the same image and losing the race is still success.
+        """
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(temp_path, path)
+        except OSError:
+            if not os.path.exists(path):
+                raise
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def touch(self, thumbnail):
+        """Mark a thumbnail as recently used so quota eviction keeps it"""
+        for path in thumbnail.values():
+            if path and os.path.exists(path):
+                os.utime(path)
+
+    def enforce_quota(self, keep=()):
+        """Evict least recently used files until under quota, never those in keep or any index"""
+        keep = set(keep)
+        files = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if not name.endswith(('.json', '.tmp')) and path not in keep and os.path.isfile(path):
+                stat = os.stat(path)
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files) + sum(os.path.getsize(path) for path in keep if path)
+        if total <= self.quota_bytes:
+            return
+
+        evicted = set()
+        for _, size, path in sorted(files):
+            if total <= self.quota_bytes:
+                break
+            os.remove(path)
+            evicted.add(path)
+            total -= size
+
+        self.thumbnails = {
+            url: thumbnail for url, thumbnail in self.thumbnails.items()
+            if not evicted.intersection(thumbnail.values())
+        }
@@ -0,0 +1,152 @@
+"""Per-stage timing, byte counts and cache hit rates for the scanner.
+
+Stages are timed with METRICS.timer(stage, source=...), which records into
+Prometheus-style histograms labelled by stage and source. Nested timers
+inherit the enclosing source, so extraction inside a feed's loop is
+attributed to that feed. render_prometheus() produces the text served at
+/metrics. Setting SCANNER_METRICS_LOG to a path also appends every timing
+as a JSON line.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 180.0)
+
+HELP = {
+    'scanner_stage_seconds': 'Time spent in each scanner stage',
+    'scanner_bytes_fetched_total': 'Response bytes downloaded',
+    'scanner_cache_lookups_total': 'Cache lookups by cache and result',
+    'scanner_source_up': 'Whether the source is being checked (0 while its circuit is open)',
+    'scanner_source_consecutive_failures': 'Feed fetch failures in a row',
+    'scanner_source_latency_ewma_seconds': 'Smoothed feed fetch latency',
+    'scanner_source_last_success_timestamp': 'Unix time of the last successful feed fetch',
+}
+
+class Histogram:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.total += value
+        self.count += 1
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, v in pairs)
+    return '{' + ','.join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + '}'
+
+def _label_key(labels):
+    return tuple(sorted((k, v) for k, v in labels.items() if v is not None))
+
+class Metrics:
+    def __init__(self, log_file=None):
+        self.lock = threading.Lock()
+        self.histograms = {}
+        self.counters = {}
+        self.gauges = {}
+        self.log_file = log_file if log_file is not None else os.environ.get('SCANNER_METRICS_LOG')
+        # Thread ident -> stack of (stage, source) for the timers currently running
+        self.active = {}
+
+    def reset(self):
+        with self.lock:
+            self.histograms.clear()
+            self.counters.clear()
+            self.gauges.clear()
+
+    def current_labels(self, thread_id=None):
+        """Innermost (stage, source) being timed on a thread, or (None, None)"""
+        stack = self.active.get(thread_id or threading.get_ident())
+        return stack[-1] if stack else (None, None)
+
+    @contextmanager
+    def timer(self, stage, source=None):
+        thread_id = threading.get_ident()
+        stack = self.active.setdefault(thread_id, [])
+        if source is None and stack:
+            source = stack[-1][1]
+        stack.append((stage, source))
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            self.observe('scanner_stage_seconds', elapsed, stage=stage, source=source)
+            self.log({'stage': stage, 'source': source, 'seconds': round(elapsed, 6)})
+
+    def observe(self, name, value, **labels):
+        key = (name, _label_key(labels))
+        with self.lock:
+            if key not in self.histograms:
+                self.histograms[key] = Histogram()
+            self.histograms[key].observe(value)
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, _label_key(labels))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def set_gauge(self, name, value, **labels):
+        with self.lock:
+            self.gauges[(name, _label_key(labels))] = value
+
+    def add_bytes(self, amount, kind, source=None):
+        if source is None:
+            source = self.current_labels()[1]
+        self.inc('scanner_bytes_fetched_total', amount, kind=kind, source=source)
+
+    def cache_lookup(self, cache, hit):
+        self.inc('scanner_cache_lookups_total', cache=cache, result='hit' if hit else 'miss')
+
+    def log(self, record):
+        if not self.log_file:
+            return
+        record = dict(record, ts=datetime.now().isoformat())
+        line = json.dumps(record) + '\n'
+        with self.lock:
+            with open(self.log_file, 'a') as f:
+                f.write(line)
+
+    def render_prometheus(self):
+        lines = []
+        with self.lock:
+            described = set()
+
+            def describe(name, kind):
+                if name not in described:
+                    described.add(name)
+                    if name in HELP:
+                        lines.append(f'# HELP {name} {HELP[name]}')
+                    lines.append(f'# TYPE {name} {kind}')
+
+            for (name, labels), value in sorted(self.counters.items()):
+                describe(name, 'counter')
+                lines.append(f'{name}{_format_labels(labels)} {value}')
+
+            for (name, labels), value in sorted(self.gauges.items()):
+                describe(name, 'gauge')
+                lines.append(f'{name}{_format_labels(labels)} {value}')
+
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                describe(name, 'histogram')
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    lines.append(f'{name}_bucket{_format_labels(labels, [("le", bound)])} {count}')
+                lines.append(f'{name}_bucket{_format_labels(labels, [("le", "+Inf")])} {histogram.count}')
+                lines.append(f'{name}_sum{_format_labels(labels)} {histogram.total}')
+                lines.append(f'{name}_count{_format_labels(labels)} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+METRICS = Metrics()
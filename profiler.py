@@ -0,0 +1,149 @@
+"""Opt-in profiling of scan cycles in a running scanner.
+
+Nothing is profiled unless asked for. SCANNER_PROFILE_CYCLES=N profiles the
+first N cycles after start-up, and sending SIGUSR1 to the process
+(kill -USR1 <pid>) profiles the next N cycles (3 if the variable is unset),
+so a slow production scanner can be inspected without restarting it.
+
+SCANNER_PROFILE_MODE picks how:
+
+- sample (default): a background thread samples the scan thread's stack
+  every SCANNER_PROFILE_INTERVAL seconds (default 0.005) and writes one
+  folded-stack file per cycle, ready for flamegraph.pl or speedscope. Each
+  stack is rooted at the source and stages METRICS was timing when it was
+  taken, e.g. "source=BBC Sport;extract;article_fetch;...", so the graph
+  splits by feed and stage before it splits by function.
+- cprofile: runs cProfile for the cycle and writes a .prof file for
+  pstats, snakeviz or flameprof.
+
+Files go to SCANNER_PROFILE_DIR (default "profiles").
+"""
+import cProfile
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+from metrics import METRICS
+
+DEFAULT_CYCLES = 3
+DEFAULT_INTERVAL = 0.005
+MODES = ('sample', 'cprofile')
+
+def frame_name(frame):
+    code = frame.f_code
+    return f'{os.path.basename(code.co_filename)}:{code.co_name}'
+
+def folded_stack(frame, labels=()):
+    """Root-first ';'-joined stack for a frame, prefixed with metric labels"""
+    names = []
+    while frame is not None:
+        names.append(frame_name(frame))
+        frame = frame.f_back
+    names.reverse()
+    # ';' separates frames in the folded format, so it cannot appear in a name
+    return ';'.join(name.replace(';', ',') for name in list(labels) + names)
+
+def stage_labels(thread_id):
+    """Source and nested stages METRICS is timing on a thread, outermost first"""
+    stack = list(METRICS.active.get(thread_id, ()))
+    labels = []
+    source = next((source for _, source in reversed(stack) if source), None)
+    if source:
+        labels.append('source=' + source)
+    labels.extend(stage for stage, _ in stack)
+    return labels
+
+class StackSampler:
+    """Counts folded stacks of one thread, sampled from a background thread"""
+
+    def __init__(self, thread_id, interval=DEFAULT_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = Counter()
+        self.stopping = threading.Event()
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name='stack-sampler', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopping.set()
+        if self.thread:
+            self.thread.join()
+
+    def run(self):
+        while not self.stopping.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[folded_stack(frame, stage_labels(self.thread_id))] += 1
+
+    def write(self, path):
+        with open(path, 'w') as f:
+            for stack, count in self.samples.most_common():
+                f.write(f'{stack} {count}\n')
+
+class CycleProfiler:
+    def __init__(self, mode=None, cycles=None, directory=None, interval=None):
+        env_cycles = os.environ.get('SCANNER_PROFILE_CYCLES', '')
+        self.mode = mode or os.environ.get('SCANNER_PROFILE_MODE', 'sample')
+        if self.mode not in MODES:
+            print(f'⚠️  Unknown SCANNER_PROFILE_MODE {self.mode!r}, using sample')
+            self.mode = 'sample'
+        self.directory = directory or os.environ.get('SCANNER_PROFILE_DIR', 'profiles')
+        self.interval = interval or float(os.environ.get('SCANNER_PROFILE_INTERVAL', DEFAULT_INTERVAL))
+        self.signal_cycles = int(env_cycles) if env_cycles.isdigit() and int(env_cycles) > 0 else DEFAULT_CYCLES
+        # Cycles still to profile; the signal handler only ever sets this
+        self.remaining = cycles if cycles is not None else (int(env_cycles) if env_cycles.isdigit() else 0)
+        self.profiled = 0
+
+    def install_signal_handler(self):
+        """Profile the next cycles on SIGUSR1. Must be called from the main thread."""
+        if not hasattr(signal, 'SIGUSR1'):
+            return
+        signal.signal(signal.SIGUSR1, lambda signum, frame: self.arm())
+
+    def arm(self, cycles=None):
+        self.remaining = cycles or self.signal_cycles
+
+    @contextmanager
+    def cycle(self):
+        """Profile the enclosed scan cycle if profiling is armed"""
+        if self.remaining <= 0:
+            yield
+            return
+
+        self.remaining -= 1
+        self.profiled += 1
+        os.makedirs(self.directory, exist_ok=True)
+        name = f'cycle-{datetime.now().strftime("%Y%m%d-%H%M%S")}-{os.getpid()}-{self.profiled}'
+        base = os.path.join(self.directory, name)
+        start = time.perf_counter()
+
+        if self.mode == 'cprofile':
+            profile = cProfile.Profile()
+            profile.enable()
+            try:
+                yield
+            finally:
+                profile.disable()
+                path = base + '.prof'
+                profile.dump_stats(path)
+                print(f'🔬 Wrote cProfile for {time.perf_counter() - start:.1f}s cycle to {path}')
+            return
+
+        sampler = StackSampler(threading.get_ident(), self.interval)
+        sampler.start()
+        try:
+            yield
+        finally:
+            sampler.stop()
+            path = base + '.folded'
+            sampler.write(path)
+            total = sum(sampler.samples.values())
+            print(f'🔬 Wrote {total} stack samples for {time.perf_counter() - start:.1f}s cycle to {path}')
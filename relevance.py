@@ -0,0 +1,90 @@
+"""Tottenham relevance scoring for feed items.
+
+Trusted Tottenham outlets are flagged once per feed, and every keyword is
+matched by a single compiled word-boundary pattern, so "spurs" no longer
+matches inside words like "spurseller" and adding player names does not add
+another scan of the text per keyword.
+"""
+import re
+
+PRIMARY_KEYWORDS = ['tottenham', 'spurs', 'thfc']
+
+# Matched against a feed's name, feed URL and homepage
+TOTTENHAM_SOURCE_MARKERS = [
+    'tottenhamhotspurnews', 'spurs-web', 'tothelaneandback',
+    'tottenhamhotspur.com', 'football.london'
+]
+
+def _trie_pattern(trie):
+    if '' in trie and len(trie) == 1:
+        return ''
+    branches = []
+    optional = False
+    for char in sorted(trie):
+        if char == '':
+            optional = True
+            continue
+        branches.append(re.escape(char) + _trie_pattern(trie[char]))
+    if len(branches) == 1 and not optional:
+        return branches[0]
+    pattern = '(?:' + '|'.join(branches) + ')'
+    return pattern + '?' if optional else pattern
+
+def keyword_pattern(keywords):
+    """Case-insensitive whole-word pattern for the keywords.
+
+    The alternatives are factored into a prefix trie ("son", "sonny" ->
+    "son(?:ny)?"), so the regex engine tests shared prefixes once instead of
+    trying every keyword at every position. With no keywords (blank ones are
+    skipped) the pattern matches nothing, rather than the empty string.
+    """
+    trie = {}
+    for keyword in keywords:
+        if not keyword.strip():
+            continue
+        node = trie
+        for char in keyword.lower():
+            node = node.setdefault(char, {})
+        node[''] = {}
+    if not trie:
+        return re.compile(r'(?!)')
+    return re.compile(r'\b' + _trie_pattern(trie) + r'\b', re.IGNORECASE)
+
+class RelevanceClassifier:
+    def __init__(self, feeds, keywords=PRIMARY_KEYWORDS, source_markers=TOTTENHAM_SOURCE_MARKERS):
+        self.keywords = []
+        self.source_markers = list(source_markers)
+        # A feed's own trusted flag wins; otherwise its name and URLs are checked
+        self.tottenham_sources = {
+            name: bool(info['trusted']) if 'trusted' in info
+            else self._matches_source_markers(name, info.get('url', ''), info.get('homepage', ''))
+            for name, info in feeds.items()
+        }
+        self.add_keywords(keywords)
+
+    def _matches_source_markers(self, *fields):
+        text = ' '.join(fields).lower()
+        return any(marker in text for marker in self.source_markers)
+
+    def add_keywords(self, keywords):
+        """Extend the keyword list, e.g. with player names, and recompile"""
+        for keyword in keywords:
+            if keyword.lower() not in self.keywords:
+                self.keywords.append(keyword.lower())
+        self.pattern = keyword_pattern(self.keywords)
+
+    def is_tottenham_source(self, source_name):
+        if source_name not in self.tottenham_sources:
+            self.tottenham_sources[source_name] = self._matches_source_markers(source_name)
+        return self.tottenham_sources[source_name]
+
+    def score(self, title, description='', full_content=''):
+        """Number of keyword mentions across the title, description and first 500 chars"""
+        text = title + ' ' + description + ' ' + full_content[:500]
+        return len(self.pattern.findall(text))
+
+    def is_relevant(self, source_name, title, description='', full_content=''):
+        if self.is_tottenham_source(source_name):
+            return True
+        text = title + ' ' + description + ' ' + full_content[:500]
+        return self.pattern.search(text) is not None
@@ -0,0 +1,100 @@
+"""Feed registry and scanner settings loaded from a config file.
+
+Feeds, keywords, the cutoff date and the scan limits used to be hard-coded
+in TottenhamAIScanner.__init__. They now live in sources.json next to this
+module (or the file named by SCANNER_CONFIG; .toml files work on Python
+3.11+), so adding a source is a config change.
+
+Every source needs a url and homepage, and may also set:
+
+- trusted: a Tottenham outlet, so every item is relevant without keywords
+- extraction: name of the extraction profile used for its article pages
+- poll_interval: minimum seconds between checks of the feed
+- items_to_check / initial_items_to_check: feed items examined per check
+- request_delay / initial_request_delay: seconds between article fetches
+
+Per-source values left out fall back to the scanner-wide ones in "settings",
+whose keys are those of DEFAULT_SETTINGS. A misspelt key in either place is
+an error rather than silently ignored.
+"""
+import json
+import os
+from datetime import datetime
+
+DEFAULT_CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sources.json')
+
+DEFAULT_SETTINGS = {
+    'keywords': ['tottenham', 'spurs', 'thfc'],
+    'cutoff_date': '2025-06-01',
+    'poll_interval': 60,
+    'articles_per_page': 20,
+    'history_limit': 500,
+    'initial_items_to_check': 25,
+    'items_to_check': 15,
+    'initial_request_delay': 1,
+    'request_delay': 2,
+}
+
+DEFAULT_EXTRACTION_PROFILE = {
+    'text_selectors': [
+        '.entry-content p', '.article-body p', '.story-body p',
+        '.content p', 'article p', 'main p'
+    ],
+    'image_selectors': [
+        'meta[property="og:image"]',
+        'meta[name="twitter:image"]',
+        '.article-image img',
+        '.featured-image img',
+        '.post-thumbnail img',
+        'article img:first-of-type'
+    ],
+}
+
+SOURCE_KEYS = {
+    'url', 'homepage', 'trusted', 'extraction', 'poll_interval',
+    'items_to_check', 'initial_items_to_check', 'request_delay', 'initial_request_delay'
+}
+
+def read_config(path):
+    if path.endswith('.toml'):
+        try:
+            import tomllib
+        except ImportError:
+            raise ValueError(f'{path}: TOML config needs Python 3.11+, use JSON instead')
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    with open(path, 'r') as f:
+        return json.load(f)
+
+class SourceRegistry:
+    def __init__(self, config_file=None):
+        self.config_file = config_file or os.environ.get('SCANNER_CONFIG') or DEFAULT_CONFIG_FILE
+        config = read_config(self.config_file)
+
+        settings = config.get('settings', {})
+        unknown = set(settings) - set(DEFAULT_SETTINGS)
+        if unknown:
+            raise ValueError(f'{self.config_file}: unknown settings {sorted(unknown)}')
+        self.settings = dict(DEFAULT_SETTINGS, **settings)
+        # TOML parses bare dates itself; JSON gives the ISO string
+        self.settings['cutoff_date'] = datetime.fromisoformat(str(self.settings['cutoff_date']))
+
+        self.extraction_profiles = {'default': DEFAULT_EXTRACTION_PROFILE}
+        for name, profile in config.get('extraction_profiles', {}).items():
+            self.extraction_profiles[name] = dict(DEFAULT_EXTRACTION_PROFILE, **profile)
+
+        # Source name -> settings, in config order
+        self.feeds = {}
+        for name, source in config.get('sources', {}).items():
+            self.add_source(name, source)
+
+    def add_source(self, name, source):
+        for key in ('url', 'homepage'):
+            if not source.get(key):
+                raise ValueError(f'{self.config_file}: source {name!r} has no {key}')
+        unknown = set(source) - SOURCE_KEYS
+        if unknown:
+            raise ValueError(f'{self.config_file}: source {name!r} has unknown settings {sorted(unknown)}')
+        if source.get('extraction', 'default') not in self.extraction_profiles:
+            raise ValueError(f'{self.config_file}: source {name!r} uses unknown extraction profile {source["extraction"]!r}')
+        self.feeds[name] = dict(source)
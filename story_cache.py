@@ -0,0 +1,195 @@
+"""Near-duplicate detection for syndicated stories.
+
+The same agency copy regularly turns up on several feeds under different
+URLs. Each extracted article text is split into clauses and gets a 64-bit
+one-permutation MinHash over their hashes. Texts whose fingerprints differ
+in only a few bits are candidates for the same story, and a candidate is
+only accepted once the exact clause sets overlap by MIN_JACCARD, so the
+earlier summary and image are never lent to an unrelated article.
+"""
+import base64
+import json
+import os
+import struct
+import zlib
+from datetime import datetime
+
+from metrics import METRICS
+
+MIN_CLAUSES = 8
+# Shorter clauses ("", "he said", "it added") recur across unrelated stories
+MIN_CLAUSE_BYTES = 12
+# Share of distinct clauses two texts must have in common to be one story
+MIN_JACCARD = 0.5
+FINGERPRINT_BITS = 64
+MAX_HAMMING_DISTANCE = 3
+# With MAX_HAMMING_DISTANCE + 1 bands, two fingerprints within the distance
+# limit must agree exactly on at least one band, so lookups only need to
+# compare against entries sharing a band instead of the whole cache.
+BANDS = MAX_HAMMING_DISTANCE + 1
+BAND_BITS = FINGERPRINT_BITS // BANDS
+BAND_MASK = (1 << BAND_BITS) - 1
+
+# Lowercases ASCII and turns clause punctuation into one separator, so the
+# text splits into clauses in a single pass over its bytes
+CLAUSE_TABLE = bytes.maketrans(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ.,;:!?',
+                               b'abcdefghijklmnopqrstuvwxyz||||||')
+# Multiplicative hashing constants; the top bit of the 64-bit product mixes every input bit
+MIX_VALUE = 0x9E3779B97F4A7C15
+MIX_DISTANCE = 0xC2B2AE3D27D4EB4F
+MASK_64 = (1 << 64) - 1
+
+def clause_hashes(text):
+    """Set of crc32s of the text's distinct clauses, or None if too short to judge"""
+    clauses = {
+        zlib.crc32(clause.strip())
+        for clause in text.encode().translate(CLAUSE_TABLE).split(b'|')
+        if len(clause) >= MIN_CLAUSE_BYTES
+    }
+    return clauses if len(clauses) >= MIN_CLAUSES else None
+
+def story_fingerprint(clauses):
+    """64-bit MinHash of a clause_hashes() set.
+
+    The low six bits of a clause hash pick one of the 64 buckets and each
+    bucket keeps its smallest hash. A bucket no clause fell into borrows the
+    minimum of the next filled bucket round the ring, mixed with its distance
+    from it (densified one-permutation hashing), so short texts do not all
+    share the same run of 0 bits. Each bucket's bit is a mix of its value;
+    two texts agree on a bit with probability about (1 + J) / 2 for clause
+    Jaccard similarity J.
+    """
+    # Walking from largest to smallest leaves each bucket holding its minimum
+    ordered = sorted(clauses, reverse=True)
+    minimums = dict(zip(map((FINGERPRINT_BITS - 1).__and__, ordered), ordered))
+    # Buckets past the last filled one wrap round to the first
+    first = min(minimums)
+    donor = minimums[first]
+    distance = first
+    fingerprint = 0
+    for bucket in range(FINGERPRINT_BITS - 1, -1, -1):
+        value = minimums.get(bucket)
+        if value is None:
+            distance += 1
+        else:
+            donor = value
+            distance = 0
+        if ((donor * MIX_VALUE + distance * MIX_DISTANCE) & MASK_64) >> 63:
+            fingerprint |= 1 << bucket
+    return fingerprint
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+def pack_clauses(clauses):
+    return struct.pack(f'>{len(clauses)}I', *sorted(clauses))
+
+def unpack_clauses(data):
+    return frozenset(struct.unpack(f'>{len(data) // 4}I', data))
+
+def hamming_distance(a, b):
+    return bin(a ^ b).count('1')
+
+def fingerprint_bands(fingerprint):
+    return [(band, fingerprint >> (band * BAND_BITS) & BAND_MASK) for band in range(BANDS)]
+
+def closest_story(fingerprint, clauses, candidates):
+    """Candidate closest to fingerprint within MAX_HAMMING_DISTANCE whose clauses confirm the match.
+
+    Candidates need '_fingerprint' and '_clauses' keys.
+    """
+    near = []
+    for entry in candidates:
+        distance = hamming_distance(fingerprint, entry['_fingerprint'])
+        if distance <= MAX_HAMMING_DISTANCE:
+            near.append((distance, entry))
+    near.sort(key=lambda item: item[0])
+    for _, entry in near:
+        if jaccard(clauses, entry['_clauses']) >= MIN_JACCARD:
+            return entry
+    return None
+
+def story_id_for(fingerprint, link):
+    # The link keeps two stories that happen to share a fingerprint apart
+    return format(fingerprint, '016x') + '-' + format(zlib.crc32(link.encode()), '08x')
+
+def new_story(fingerprint, clauses, link, source, image_url=None, summary=None):
+    """Story cache entry for the first copy of a story, in its saved form"""
+    return {
+        'fingerprint': format(fingerprint, '016x'),
+        'story_id': story_id_for(fingerprint, link),
+        'clauses': base64.b64encode(pack_clauses(clauses)).decode(),
+        'link': link,
+        'source': source,
+        'image_url': image_url,
+        'summary': summary,
+        'found_at': datetime.now().isoformat()
+    }
+
+def with_match_keys(entry):
+    """Add the parsed fingerprint and clause set closest_story compares"""
+    entry['_fingerprint'] = int(entry['fingerprint'], 16)
+    entry['_clauses'] = unpack_clauses(base64.b64decode(entry['clauses']))
+    return entry
+
+class StoryCache:
+    """Summary and image cache keyed by content fingerprint, persisted as JSON"""
+
+    def __init__(self, filename='story_cache.json', max_entries=2000):
+        self.filename = filename
+        self.max_entries = max_entries
+        self.entries = []
+        self.bands = {}
+        for entry in self.load():
+            # Entries from before clause sets were kept cannot be confirmed
+            if 'clauses' in entry:
+                self._index(entry)
+
+    def load(self):
+        if os.path.exists(self.filename):
+            try:
+                with open(self.filename, 'r') as f:
+                    return json.load(f).get('entries', [])
+            except:
+                return []
+        return []
+
+    def save(self):
+        with open(self.filename, 'w') as f:
+            entries = [{k: v for k, v in entry.items() if not k.startswith('_')} for entry in self.entries]
+            json.dump({'entries': entries}, f, indent=2)
+
+    def _index(self, entry):
+        with_match_keys(entry)
+        self.entries.append(entry)
+        for key in fingerprint_bands(entry['_fingerprint']):
+            self.bands.setdefault(key, []).append(entry)
+
+    def _evict_oldest(self):
+        oldest = self.entries.pop(0)
+        for key in fingerprint_bands(oldest['_fingerprint']):
+            self.bands[key].remove(oldest)
+            if not self.bands[key]:
+                del self.bands[key]
+
+    def lookup(self, fingerprint, clauses):
+        """Closest cached story within MAX_HAMMING_DISTANCE sharing MIN_JACCARD of its clauses, or None"""
+        candidates = {}
+        for key in fingerprint_bands(fingerprint):
+            for entry in self.bands.get(key, ()):
+                candidates[id(entry)] = entry
+        best = closest_story(fingerprint, clauses, candidates.values())
+
+        METRICS.cache_lookup('story', best is not None)
+        return best
+
+    def add(self, fingerprint, clauses, link, source, image_url=None, summary=None):
+        """Record a new story; later copies are grouped under its story_id"""
+        entry = new_story(fingerprint, clauses, link, source, image_url, summary)
+        self._index(entry)
+        while len(self.entries) > self.max_entries:
+            self._evict_oldest()
+        return entry
+
+    def set_summary(self, entry, summary):
+        entry['summary'] = summary
@@ -0,0 +1,15 @@
+import os
+import sys
+
+# The scanner's modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from tottenham_scanner import TottenhamAIScanner
+
+@pytest.fixture
+def scanner(tmp_path, monkeypatch):
+    """A scanner whose files (pages, caches, queues) all land in tmp_path"""
+    monkeypatch.chdir(tmp_path)
+    return TottenhamAIScanner()
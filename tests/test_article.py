@@ -0,0 +1,77 @@
+import marshal
+
+import pytest
+
+from article import BINARY_MAGIC, BINARY_VERSION, Article, read_binary, write_binary
+from tottenham_scanner import TottenhamAIScanner
+
+def sample_articles():
+    return [
+        Article('BBC Sport', 'https://www.bbc.co.uk/sport', 'Spurs win', 'https://example.com/1',
+                image_url='https://example.com/1.jpg', thumbnail={'jpeg': 'thumbs/a.jpg', 'webp': 'thumbs/a.webp'},
+                published_date='05 June 2025, 11:14', story_id='00ff', summary='Spurs won.',
+                has_full_content=True, content_length=1200, found_at='2025-06-05T11:20:00',
+                also_reported_by=[{'source': 'Sky Sports', 'link': 'https://example.com/copy'}]),
+        Article('BBC Sport', 'https://www.bbc.co.uk/sport', 'Squad news', 'https://example.com/2',
+                summary='Team news.', found_at='2025-06-04T09:00:00'),
+        Article('Spurs Web', title='Transfer latest', link='https://example.com/3'),
+    ]
+
+def test_dict_round_trip():
+    for article in sample_articles():
+        assert Article.from_dict(article.to_dict()).to_dict() == article.to_dict()
+
+def test_binary_round_trip(tmp_path):
+    filename = str(tmp_path / 'articles_data.bin')
+    articles = sample_articles()
+    write_binary(articles, filename)
+    loaded = read_binary(filename)
+    assert [article.to_dict() for article in loaded] == [article.to_dict() for article in articles]
+    assert [article.sort_timestamp for article in loaded] == [article.sort_timestamp for article in articles]
+    assert loaded[0].source is loaded[1].source
+
+def test_empty_list_round_trip(tmp_path):
+    filename = str(tmp_path / 'articles_data.bin')
+    write_binary([], filename)
+    assert read_binary(filename) == []
+
+def write_raw(filename, saved):
+    with open(filename, 'wb') as f:
+        f.write(BINARY_MAGIC + bytes([BINARY_VERSION]) + marshal.dumps(saved))
+
+@pytest.mark.parametrize('damage', ['truncated', 'header_only', 'empty', 'missing_column', 'short_column', 'bad_magic'])
+def test_damaged_file_reads_as_none(tmp_path, damage):
+    filename = str(tmp_path / 'articles_data.bin')
+    write_binary(sample_articles(), filename)
+    with open(filename, 'rb') as f:
+        data = f.read()
+    saved = marshal.loads(data[len(BINARY_MAGIC) + 1:])
+
+    if damage == 'truncated':
+        with open(filename, 'wb') as f:
+            f.write(data[:len(data) // 2])
+    elif damage == 'header_only':
+        with open(filename, 'wb') as f:
+            f.write(BINARY_MAGIC)
+    elif damage == 'empty':
+        open(filename, 'wb').close()
+    elif damage == 'missing_column':
+        del saved['columns']['summary']
+        write_raw(filename, saved)
+    elif damage == 'short_column':
+        saved['columns']['title'].pop()
+        write_raw(filename, saved)
+    else:
+        with open(filename, 'wb') as f:
+            f.write(b'NOTARTS' + data[len(BINARY_MAGIC):])
+    assert read_binary(filename) is None
+
+def test_scanner_falls_back_to_json(scanner):
+    scanner.create_live_html([])
+    scanner.save_all_articles(sample_articles())
+    with open(scanner.articles_binary_file, 'r+b') as f:
+        f.truncate(40)
+
+    links = [article.link for article in TottenhamAIScanner().load_existing_articles()]
+    assert links == [article.link for article in scanner.load_existing_articles()]
+    assert len(links) == 3
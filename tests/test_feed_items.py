@@ -0,0 +1,52 @@
+import tottenham_scanner
+from tottenham_scanner import strip_html
+
+FEED = b'''<?xml version="1.0"?>
+<rss><channel>
+<item><title>Tottenham seen story</title><link>https://example.com/seen</link>
+  <pubDate>Thu, 05 Jun 2025 11:14:56 GMT</pubDate><description>&lt;p&gt;seen&lt;/p&gt;</description></item>
+<item><title>Tottenham queued story</title><link>https://example.com/queued</link>
+  <pubDate>Thu, 05 Jun 2025 11:14:56 GMT</pubDate><description>&lt;p&gt;queued&lt;/p&gt;</description></item>
+<item><title>Tottenham old story</title><link>https://example.com/old</link>
+  <pubDate>Thu, 05 Jun 2014 11:14:56 GMT</pubDate><description>&lt;p&gt;old&lt;/p&gt;</description></item>
+<item><title>Tottenham new story</title><link>https://example.com/new</link>
+  <pubDate>Thu, 05 Jun 2025 11:14:56 GMT</pubDate><description>&lt;p&gt;new&lt;/p&gt;</description></item>
+</channel></rss>'''
+
+class Response:
+    content = FEED
+
+    def raise_for_status(self):
+        pass
+
+def test_quoted_greater_than_stays_inside_the_tag():
+    assert strip_html('<a title="a > b" href="x">Spurs</a> win') == 'Spurs win'
+    assert strip_html("<img alt='5 > 4'>Kane") == 'Kane'
+
+def test_entities_only():
+    assert strip_html('Spurs &amp; Arsenal &#8211; derby') == 'Spurs & Arsenal – derby'
+
+def test_bare_less_than_is_kept():
+    assert strip_html('Spurs 3 < 4 points') == 'Spurs 3 < 4 points'
+    assert strip_html('plain text') == 'plain text'
+
+def test_seen_and_queued_items_skipped_before_description_is_cleaned(scanner, monkeypatch):
+    source_name = next(iter(scanner.feeds))
+    scanner.feeds = {source_name: dict(scanner.feeds[source_name], trusted=True, request_delay=0)}
+    scanner.seen_articles[scanner.get_article_id('https://example.com/seen')] = {'title': 'seen'}
+    scanner.work_queue.add(scanner.get_article_id('https://example.com/queued'), {'title': 'queued'})
+
+    cleaned = []
+    def recording_strip_html(text):
+        cleaned.append(text)
+        return strip_html(text)
+    monkeypatch.setattr(tottenham_scanner, 'strip_html', recording_strip_html)
+    monkeypatch.setattr(tottenham_scanner.requests, 'get', lambda url, timeout: Response())
+    # The queued job stays queued, as if another cycle were still working on it
+    monkeypatch.setattr(scanner, 'resume_jobs', lambda: ([], []))
+    monkeypatch.setattr(scanner, 'extract_job', lambda article_id, job: dict(job, article_id=article_id, story=None, full_content=''))
+    monkeypatch.setattr(scanner, 'finish_article', lambda article_id, pending: pending['link'])
+    monkeypatch.setattr(scanner, 'create_smart_summaries', lambda articles: ['Summary.' for _ in articles])
+
+    assert scanner.check_for_articles() == ['https://example.com/new']
+    assert cleaned == ['<p>new</p>']
@@ -0,0 +1,63 @@
+import io
+import os
+
+import pytest
+from PIL import Image
+
+from benchmark import Fixtures, FixtureServer
+from tottenham_scanner import TottenhamAIScanner
+
+IMAGE_URL = 'https://img.example/news/lead-image.jpg'
+ARTICLE_URL = 'https://spursweb.example/news/maddison-returns'
+FEED_URL = 'https://spursweb.example/feed'
+
+class Recorded:
+    def __init__(self, content, content_type):
+        self.content = content
+        self.headers = {'Content-Type': content_type}
+
+def jpeg_bytes():
+    buffer = io.BytesIO()
+    Image.new('RGB', (1200, 800), (19, 34, 87)).save(buffer, 'JPEG')
+    return buffer.getvalue()
+
+@pytest.fixture
+def fixtures(tmp_path):
+    fixtures = Fixtures(str(tmp_path / 'fixtures'))
+    paragraph = '<p>Tottenham midfielder James Maddison is back in training ahead of the weekend. ' * 5 + '</p>'
+    article = (f'<html><head><meta property="og:image" content="{IMAGE_URL}"></head>'
+               f'<body><article>{paragraph * 3}</article></body></html>').encode()
+    feed = (f'<rss><channel><item><title>Maddison returns to Tottenham training</title>'
+            f'<link>{ARTICLE_URL}</link><description>Spurs boost</description></item></channel></rss>').encode()
+    fixtures.manifest['images'][IMAGE_URL] = fixtures.store(IMAGE_URL, Recorded(jpeg_bytes(), 'image/jpeg'))
+    fixtures.manifest['articles'][ARTICLE_URL] = {
+        'key': fixtures.store(ARTICLE_URL, Recorded(article, 'text/html')), 'image': IMAGE_URL
+    }
+    fixtures.manifest['feeds']['SpursWeb'] = {
+        'url': FEED_URL, 'homepage': 'https://spursweb.example',
+        'key': fixtures.store(FEED_URL, Recorded(feed, 'application/rss+xml'))
+    }
+    return fixtures
+
+def test_rewritten_image_url_keeps_extension(fixtures):
+    server = FixtureServer(fixtures)
+    local = server.url(fixtures.manifest['images'][IMAGE_URL], IMAGE_URL)
+    assert local.endswith('/lead-image.jpg')
+    assert TottenhamAIScanner.is_valid_image_url(None, local)
+
+def test_replay_produces_thumbnails(fixtures, tmp_path, monkeypatch):
+    workdir = tmp_path / 'scan'
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+    server = FixtureServer(fixtures).start()
+    try:
+        scanner = TottenhamAIScanner()
+        scanner.initial_request_delay = scanner.request_delay = 0
+        scanner.feeds = {'SpursWeb': dict(scanner.feeds['SpursWeb'], url=server.feed_urls['SpursWeb'])}
+        articles = scanner.check_for_articles()
+    finally:
+        server.stop()
+
+    assert len(articles) == 1
+    assert articles[0].image_url.startswith(server.base_url)
+    assert articles[0].thumbnail and os.path.exists(articles[0].thumbnail['jpeg'])
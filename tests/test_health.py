@@ -0,0 +1,79 @@
+import pytest
+
+import health
+from health import BASE_COOLDOWN, DEFAULT_TIMEOUT, FAILURE_THRESHOLD, MIN_TIMEOUT, PROBE_TIMEOUT, HealthTracker
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(health.time, 'time', clock.time)
+    return clock
+
+@pytest.fixture
+def tracker(tmp_path):
+    return HealthTracker(str(tmp_path / 'source_health.json'))
+
+def test_circuit_opens_after_threshold(tracker, clock):
+    for _ in range(FAILURE_THRESHOLD - 1):
+        tracker.record_failure('BBC Sport', 'timeout')
+    assert tracker.should_poll('BBC Sport')
+
+    tracker.record_failure('BBC Sport', 'timeout')
+    assert not tracker.should_poll('BBC Sport')
+    assert tracker.state('BBC Sport')['open_until'] == clock.now + BASE_COOLDOWN
+
+def test_probe_after_cooldown_then_close_on_success(tracker, clock):
+    for _ in range(FAILURE_THRESHOLD):
+        tracker.record_failure('BBC Sport', 'timeout')
+    clock.now += BASE_COOLDOWN
+    assert tracker.should_poll('BBC Sport') and tracker.is_probe('BBC Sport')
+    assert tracker.timeout('BBC Sport') == PROBE_TIMEOUT
+
+    tracker.record_success('BBC Sport', 0.5)
+    assert not tracker.is_probe('BBC Sport')
+    assert tracker.state('BBC Sport')['consecutive_failures'] == 0
+    assert tracker.unhealthy(['BBC Sport']) == []
+
+def test_failed_probe_reopens_for_longer(tracker, clock):
+    for _ in range(FAILURE_THRESHOLD):
+        tracker.record_failure('BBC Sport', 'timeout')
+    clock.now += BASE_COOLDOWN
+    tracker.record_failure('BBC Sport', 'timeout')
+    assert tracker.state('BBC Sport')['open_until'] == clock.now + 2 * BASE_COOLDOWN
+
+def test_timeout_follows_latency(tracker, clock):
+    assert tracker.timeout('BBC Sport') == DEFAULT_TIMEOUT
+    tracker.record_success('BBC Sport', 0.1)
+    assert tracker.timeout('BBC Sport') == MIN_TIMEOUT
+    tracker.record_success('Slow Site', 100)
+    assert tracker.timeout('Slow Site') == DEFAULT_TIMEOUT
+
+def test_state_survives_reload(tracker, tmp_path):
+    tracker.record_failure('BBC Sport', 'timeout')
+    tracker.save()
+    reloaded = HealthTracker(str(tmp_path / 'source_health.json'))
+    assert reloaded.unhealthy(['BBC Sport'])[0][1]['last_error'] == 'timeout'
+
+def test_footer_refreshed_when_health_changes(scanner):
+    scanner.create_live_html([])
+    source_name = next(iter(scanner.feeds))
+    assert not scanner.refresh_health_footer()
+
+    scanner.health.record_failure(source_name, 'timeout')
+    assert scanner.refresh_health_footer()
+    with open(scanner.html_filename) as f:
+        page = f.read()
+    assert f'{source_name} failing (1 in a row)' in page
+    assert page.count('<footer class="source-health">') == 1
+
+    scanner.health.record_success(source_name, 0.2)
+    assert scanner.refresh_health_footer()
+    with open(scanner.html_filename) as f:
+        assert 'failing' not in f.read()
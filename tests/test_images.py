@@ -0,0 +1,77 @@
+import io
+import os
+
+import pytest
+from PIL import Image
+
+import images
+from images import ImageCache
+
+IMAGE_URL = 'https://example.com/agency.jpg'
+
+def jpeg_bytes():
+    buffer = io.BytesIO()
+    Image.new('RGB', (1200, 800), (19, 34, 87)).save(buffer, 'JPEG')
+    return buffer.getvalue()
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = ImageCache(str(tmp_path / 'thumbs'), quota_bytes=None, index_name='index_worker-0.json')
+    monkeypatch.setattr(cache, 'download', lambda image_url: jpeg_bytes())
+    return cache
+
+def test_losing_the_rename_race_is_success(cache, monkeypatch):
+    real_replace = os.replace
+
+    def replace_after_other_worker(source, destination):
+        # Another worker sharing thumbs/ renames the same content-hashed file into place first
+        with open(destination, 'wb') as f:
+            f.write(b'written by worker-1')
+        raise FileNotFoundError(source)
+    monkeypatch.setattr(images.os, 'replace', replace_after_other_worker)
+
+    thumbnail = cache.thumbnail(IMAGE_URL)
+    monkeypatch.setattr(images.os, 'replace', real_replace)
+    assert thumbnail is not None and os.path.exists(thumbnail['jpeg'])
+    assert not cache.is_rejected(IMAGE_URL)
+    assert not [name for name in os.listdir(cache.directory) if name.endswith('.tmp')]
+
+def test_each_writer_uses_its_own_temp_file(cache, monkeypatch):
+    temp_paths = []
+    real_replace = os.replace
+
+    def record_replace(source, destination):
+        temp_paths.append(source)
+        real_replace(source, destination)
+    monkeypatch.setattr(images.os, 'replace', record_replace)
+
+    other = ImageCache(cache.directory, quota_bytes=None, index_name='index_worker-1.json')
+    monkeypatch.setattr(other, 'download', lambda image_url: jpeg_bytes())
+    cache.thumbnail(IMAGE_URL)
+    for path in cache.thumbnails[IMAGE_URL].values():
+        if path:
+            os.remove(path)
+    other.thumbnail(IMAGE_URL)
+    assert len(temp_paths) == len(set(temp_paths)) >= 2
+
+def test_disk_error_does_not_reject_the_image(cache, monkeypatch):
+    def disk_full(path, write):
+        raise OSError(28, 'No space left on device')
+    monkeypatch.setattr(cache, 'write_file', disk_full)
+    assert cache.thumbnail(IMAGE_URL) is None
+    assert not cache.is_rejected(IMAGE_URL)
+
+    monkeypatch.undo()
+    monkeypatch.setattr(cache, 'download', lambda image_url: jpeg_bytes())
+    assert cache.thumbnail(IMAGE_URL) is not None
+
+def test_unreadable_image_is_rejected(cache, monkeypatch):
+    # Looks like a JPEG to the signature check, but Pillow cannot read it
+    monkeypatch.setattr(cache, 'download', lambda image_url: b'\xff\xd8\xff' + b'\x00' * 64)
+    assert cache.thumbnail(IMAGE_URL) is None
+    assert cache.is_rejected(IMAGE_URL)
+
+def test_non_image_is_rejected(cache, monkeypatch):
+    monkeypatch.setattr(cache, 'download', lambda image_url: b'<html>Not found</html>')
+    assert cache.thumbnail(IMAGE_URL) is None
+    assert cache.is_rejected(IMAGE_URL)
@@ -0,0 +1,91 @@
+import os
+import re
+
+import pytest
+
+from article import Article
+from tottenham_scanner import TottenhamAIScanner
+
+@pytest.fixture
+def scanner(scanner):
+    scanner.articles_per_page = 3
+    scanner.history_limit = 9
+    scanner.create_live_html([])
+    return scanner
+
+def article(number):
+    return Article('SpursWeb', title=f'Story {number}', link=f'https://example.com/{number}',
+                   summary='Summary.', sort_timestamp=float(number))
+
+def links(filename):
+    with open(filename) as f:
+        return [int(number) for number in re.findall(r'href="https://example.com/(\d+)" class="read-full-link"', f.read())]
+
+def next_page(filename):
+    with open(filename) as f:
+        match = re.search(r'href="([^"]+)" class="next-page"', f.read())
+    return match.group(1) if match else None
+
+def scroll(scanner):
+    """Story numbers in the order infinite scroll shows them"""
+    shown = []
+    filename = scanner.html_filename
+    while filename:
+        shown += links(filename)
+        filename = next_page(filename)
+    return shown
+
+def test_archive_pages_keep_their_articles_as_stories_arrive(scanner):
+    scanner.save_all_articles([article(n) for n in range(1, 8)])
+    assert links('page-1.html') == [3, 2, 1]
+    assert not os.path.exists('page-2.html')
+
+    for number in range(8, 10):
+        scanner.save_all_articles([article(number)])
+        assert links('page-1.html') == [3, 2, 1]
+        assert scroll(scanner) == list(range(number, 0, -1))
+    assert links('page-2.html') == [6, 5, 4]
+
+def test_trimming_drops_whole_pages_from_the_oldest_end(scanner):
+    scanner.save_all_articles([article(n) for n in range(1, 10)])
+    page_2 = links('page-2.html')
+
+    scanner.save_all_articles([article(10)])
+    assert scanner.oldest_page == 2
+    assert not os.path.exists('page-1.html')
+    assert links('page-2.html') == page_2
+    assert scroll(scanner) == list(range(10, 3, -1))
+
+def test_oldest_page_survives_restart(scanner):
+    scanner.save_all_articles([article(n) for n in range(1, 11)])
+    assert TottenhamAIScanner().oldest_page == 2
+
+def test_front_page_holds_one_to_two_pages(scanner):
+    scanner.save_all_articles([article(n) for n in range(1, 6)])
+    assert links(scanner.html_filename) == [5, 4, 3, 2, 1]
+    assert next_page(scanner.html_filename) is None
+
+    scanner.save_all_articles([article(6)])
+    assert links(scanner.html_filename) == [6, 5, 4]
+    assert next_page(scanner.html_filename) == 'page-1.html'
+
+def card_links(filename):
+    with open(filename) as f:
+        return re.findall(r'href="([^"]+)" class="read-full-link"', f.read())
+
+def test_repeat_found_later_joins_the_earlier_card(scanner):
+    original = Article('BBC Sport', title='Spurs sign striker', link='https://bbc.example/story', summary='Summary.',
+                       story_id='abc', found_at='2025-06-05T10:00:00', sort_timestamp=2.5)
+    scanner.save_all_articles([article(n) for n in range(1, 8)] + [original])
+    assert original.link in card_links('page-1.html')
+    page_before = card_links('page-1.html')
+
+    repeat = Article('TeamTalk', title='Spurs sign striker', link='https://teamtalk.example/story', summary='Summary.',
+                     story_id='abc', found_at='2025-06-05T12:00:00', sort_timestamp=99.0)
+    scanner.save_all_articles([repeat])
+
+    kept = [saved for saved in scanner.load_existing_articles() if saved.story_id == 'abc']
+    assert [saved.link for saved in kept] == [original.link]
+    assert kept[0].also_reported_by == ({'source': 'TeamTalk', 'link': repeat.link},)
+    assert card_links('page-1.html') == page_before
+    assert repeat.link not in card_links(scanner.html_filename)
@@ -0,0 +1,87 @@
+import os
+import time
+
+import pytest
+
+from metrics import METRICS
+from profiler import DEFAULT_CYCLES, CycleProfiler
+
+def busy(seconds=0.05):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+def profiled_files(directory, suffix):
+    return sorted(name for name in os.listdir(directory) if name.endswith(suffix)) if os.path.isdir(directory) else []
+
+@pytest.fixture(autouse=True)
+def no_profile_env(monkeypatch):
+    for name in ('SCANNER_PROFILE_CYCLES', 'SCANNER_PROFILE_MODE', 'SCANNER_PROFILE_DIR', 'SCANNER_PROFILE_INTERVAL'):
+        monkeypatch.delenv(name, raising=False)
+
+def test_one_folded_file_per_armed_cycle(tmp_path):
+    directory = str(tmp_path / 'profiles')
+    profiler = CycleProfiler(cycles=2, directory=directory, interval=0.001)
+    for _ in range(3):
+        with profiler.cycle():
+            with METRICS.timer('source', 'BBC Sport'):
+                with METRICS.timer('extract'):
+                    busy()
+
+    files = profiled_files(directory, '.folded')
+    assert len(files) == 2 and profiler.remaining == 0
+    for name in files:
+        with open(os.path.join(directory, name)) as f:
+            lines = f.read().splitlines()
+        stacks = [line.rsplit(' ', 1)[0] for line in lines]
+        assert all(int(line.rsplit(' ', 1)[1]) > 0 for line in lines)
+        assert any(stack.startswith('source=BBC Sport;source;extract;') and 'test_profiler.py:busy' in stack
+                   for stack in stacks)
+
+def test_stacks_outside_timers_have_no_labels(tmp_path):
+    directory = str(tmp_path / 'profiles')
+    profiler = CycleProfiler(cycles=1, directory=directory, interval=0.001)
+    with profiler.cycle():
+        busy()
+    with open(os.path.join(directory, profiled_files(directory, '.folded')[0])) as f:
+        assert not any(line.startswith('source=') for line in f)
+
+def test_cprofile_mode_writes_prof_file(tmp_path):
+    directory = str(tmp_path / 'profiles')
+    profiler = CycleProfiler(mode='cprofile', cycles=1, directory=directory)
+    with profiler.cycle():
+        busy(0.01)
+    assert len(profiled_files(directory, '.prof')) == 1
+
+def test_unarmed_cycle_writes_nothing(tmp_path):
+    directory = str(tmp_path / 'profiles')
+    with CycleProfiler(directory=directory).cycle():
+        busy(0.01)
+    assert not os.path.exists(directory)
+
+def test_arm_profiles_the_next_cycles(tmp_path):
+    directory = str(tmp_path / 'profiles')
+    profiler = CycleProfiler(directory=directory, interval=0.001)
+    profiler.arm()
+    assert profiler.remaining == DEFAULT_CYCLES
+    profiler.arm(1)
+    assert profiler.remaining == 1
+    for _ in range(2):
+        with profiler.cycle():
+            busy(0.01)
+    assert len(profiled_files(directory, '.folded')) == 1
+
+@pytest.mark.parametrize('value, remaining, signal_cycles', [
+    ('2', 2, 2),
+    ('0', 0, DEFAULT_CYCLES),
+    ('-1', 0, DEFAULT_CYCLES),
+    ('abc', 0, DEFAULT_CYCLES),
+    ('', 0, DEFAULT_CYCLES),
+])
+def test_profile_cycles_from_environment(monkeypatch, value, remaining, signal_cycles):
+    monkeypatch.setenv('SCANNER_PROFILE_CYCLES', value)
+    profiler = CycleProfiler()
+    assert profiler.remaining == remaining
+    assert profiler.signal_cycles == signal_cycles
+    profiler.arm()
+    assert profiler.remaining == signal_cycles
@@ -0,0 +1,31 @@
+from relevance import RelevanceClassifier, keyword_pattern
+
+def test_whole_words_only():
+    pattern = keyword_pattern(['spurs', 'son', 'sonny'])
+    assert pattern.findall('Spurs win as Son and SONNY score') == ['Spurs', 'Son', 'SONNY']
+    assert pattern.search('spurseller at the sonar conference') is None
+
+def test_shared_prefixes_are_factored():
+    assert keyword_pattern(['son', 'sonny']).pattern == r'\bson(?:ny)?\b'
+
+def test_special_characters_are_escaped():
+    assert keyword_pattern(['c.b']).search('cab') is None
+
+def test_no_keywords_matches_nothing():
+    for keywords in ([], [''], ['  ']):
+        pattern = keyword_pattern(keywords)
+        assert pattern.search('Tottenham beat Arsenal') is None
+        assert pattern.search('') is None
+
+def test_classifier_without_keywords_trusts_only_sources():
+    feeds = {
+        'Spurs Web': {'url': 'https://www.spurs-web.com/feed', 'homepage': '#'},
+        'BBC Sport': {'url': 'https://feeds.bbci.co.uk/sport/football/rss.xml', 'homepage': '#'},
+    }
+    classifier = RelevanceClassifier(feeds, keywords=[])
+    assert classifier.is_relevant('Spurs Web', 'Anything at all')
+    assert not classifier.is_relevant('BBC Sport', 'Tottenham win')
+    assert classifier.score('Tottenham win') == 0
+
+    classifier.add_keywords(['Tottenham'])
+    assert classifier.is_relevant('BBC Sport', 'Tottenham win')
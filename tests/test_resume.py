@@ -0,0 +1,33 @@
+from workqueue import MAX_ATTEMPTS
+
+def job(link):
+    return {
+        'source': 'SpursWeb', 'source_homepage': '#', 'title': 'Story ' + link, 'link': link,
+        'image_url': None, 'thumbnail': None, 'published_date': None
+    }
+
+def test_failing_resumed_job_does_not_block_others(scanner, monkeypatch):
+    scanner.work_queue.add('bad', job('https://example.com/bad'))
+    finished = dict(job('https://example.com/good'), summary='Kept.', story_id=None)
+    scanner.work_queue.add('good', finished)
+    scanner.work_queue.checkpoint('good', 'summarised', finished)
+
+    def extract_job(article_id, queued):
+        raise RuntimeError('page parser blew up')
+    monkeypatch.setattr(scanner, 'extract_job', extract_job)
+
+    for cycle in range(MAX_ATTEMPTS):
+        pending, finished_articles = scanner.resume_jobs()
+        assert pending == []
+        assert [article.link for article in finished_articles] == ['https://example.com/good']
+
+    assert [article_id for article_id, _, _ in scanner.work_queue.unfinished()] == ['good']
+    assert [article_id for article_id, _, _ in scanner.work_queue.failed()] == ['bad']
+
+def test_job_that_keeps_killing_the_scanner_is_given_up(scanner):
+    scanner.work_queue.add('bad', job('https://example.com/bad'))
+    # As if the process died mid-job on every earlier resume
+    for _ in range(MAX_ATTEMPTS):
+        scanner.work_queue.start_attempt('bad')
+    assert scanner.resume_jobs() == ([], [])
+    assert [article_id for article_id, _, _ in scanner.work_queue.failed()] == ['bad']
@@ -0,0 +1,49 @@
+import pytest
+
+from article import Article
+from search_index import MAX_LIMIT, SearchIndex, match_expression
+
+def record(n, title, summary=''):
+    return {'link': f'https://example.com/{n}', 'title': title, 'source': 'SpursWeb',
+            'published_date': None, 'summary': summary, 'found_at': None}
+
+@pytest.fixture
+def index(tmp_path):
+    index = SearchIndex(str(tmp_path / 'search_index.db'))
+    yield index
+    index.close()
+
+def test_match_expression_quotes_terms():
+    assert match_expression('kulusevski transfer') == '"kulusevski" "transfer"'
+    assert match_expression('AND ( "NEAR') == '"AND" "NEAR"'
+    assert match_expression('!!!') == ''
+
+def test_newest_first_and_every_term_required(index):
+    index.add(record(1, 'Kulusevski transfer talk'), 'body')
+    index.add(record(2, 'Kulusevski injury update'), 'body')
+    index.add(record(3, 'Transfer window opens'), 'body')
+    assert [r['link'] for r in index.search('kulusevski')] == ['https://example.com/2', 'https://example.com/1']
+    assert [r['link'] for r in index.search('kulusevski transfer')] == ['https://example.com/1']
+    assert index.search('') == []
+
+def test_add_is_idempotent(index):
+    assert index.add(record(1, 'Son scores'), 'text')
+    assert not index.add(record(1, 'Son scores'), 'text')
+    assert len(index) == 1
+
+def test_relevance_weights_title_over_body(index):
+    index.add(record(1, 'Match report', 'Romero'), 'nothing here')
+    index.add(record(2, 'Romero signs new deal'), 'unrelated body')
+    index.add(record(3, 'Training notes'), 'romero trained alone')
+    links = [r['link'] for r in index.search('romero', sort='relevance')]
+    assert links[0] == 'https://example.com/2' and set(links) == {f'https://example.com/{n}' for n in (1, 2, 3)}
+
+def test_limit_is_clamped(index):
+    index.add_many((record(n, f'Spurs story {n}'), '') for n in range(MAX_LIMIT + 10))
+    assert len(index.search('spurs', limit=1000)) == MAX_LIMIT
+    assert len(index.search('spurs', limit=0)) == 1
+
+def test_backfill_keeps_newest_first(scanner):
+    saved = [Article('SpursWeb', title=f'Spurs story {n}', link=f'https://example.com/{n}') for n in (3, 2, 1)]
+    scanner.backfill_search_index(saved)
+    assert [r['link'] for r in scanner.search_index.search('spurs')] == [a.link for a in saved]
@@ -0,0 +1,36 @@
+import json
+import os
+
+import pytest
+
+from sources import DEFAULT_SETTINGS, SourceRegistry
+
+SOURCE = {'url': 'https://example.com/feed', 'homepage': 'https://example.com'}
+
+def write_config(tmp_path, config):
+    path = tmp_path / 'sources.json'
+    path.write_text(json.dumps(config))
+    return str(path)
+
+def test_settings_fall_back_to_defaults(tmp_path):
+    registry = SourceRegistry(write_config(tmp_path, {'settings': {'history_limit': 50}, 'sources': {'Example': SOURCE}}))
+    assert registry.settings['history_limit'] == 50
+    assert registry.settings['items_to_check'] == DEFAULT_SETTINGS['items_to_check']
+    assert list(registry.feeds) == ['Example']
+
+def test_misspelt_setting_rejected(tmp_path):
+    with pytest.raises(ValueError, match='histroy_limit'):
+        SourceRegistry(write_config(tmp_path, {'settings': {'histroy_limit': 50}}))
+
+def test_misspelt_source_key_rejected(tmp_path):
+    with pytest.raises(ValueError, match='trustd'):
+        SourceRegistry(write_config(tmp_path, {'sources': {'Example': dict(SOURCE, trustd=True)}}))
+
+def test_unknown_extraction_profile_rejected(tmp_path):
+    with pytest.raises(ValueError, match='missing'):
+        SourceRegistry(write_config(tmp_path, {'sources': {'Example': dict(SOURCE, extraction='missing')}}))
+
+def test_caches_opened_on_first_use(scanner):
+    assert not os.path.exists('thumbs')
+    assert scanner.image_cache is scanner.image_cache and os.path.isdir('thumbs')
+    assert scanner.story_cache.entries == []
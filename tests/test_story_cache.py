@@ -0,0 +1,89 @@
+import random
+
+from story_cache import (MAX_HAMMING_DISTANCE, StoryCache, clause_hashes, fingerprint_bands, hamming_distance,
+                         story_fingerprint)
+
+WORDS = ('tottenham spurs manager squad striker keeper defender midfield press '
+         'league cup europe transfer fee loan contract injury return training '
+         'goal assist chance tackle save win draw defeat fans stadium north london').split()
+
+def article(seed, sentences=30):
+    rng = random.Random(seed)
+    return ' '.join(
+        ', '.join(' '.join(rng.choice(WORDS) for _ in range(rng.randint(4, 9))) for _ in range(rng.randint(1, 3))).capitalize() + '.'
+        for _ in range(sentences)
+    )
+
+def fingerprint(text):
+    return story_fingerprint(clause_hashes(text))
+
+def add(cache, text, link, source='BBC Sport', **kwargs):
+    clauses = clause_hashes(text)
+    return cache.add(story_fingerprint(clauses), clauses, link, source, **kwargs)
+
+def lookup(cache, text):
+    clauses = clause_hashes(text)
+    return cache.lookup(story_fingerprint(clauses), clauses)
+
+def test_syndicated_copies_stay_close():
+    text = article(1)
+    copies = [
+        'LONDON (Agency) - ' + text,
+        text + ' Follow us for more Spurs news.',
+        text.replace(' ', ' transfer ', 1),
+        text.upper(),
+    ]
+    for copy in copies:
+        assert hamming_distance(fingerprint(text), fingerprint(copy)) <= MAX_HAMMING_DISTANCE
+
+def test_unrelated_stories_are_far_apart():
+    fingerprints = [fingerprint(article(seed)) for seed in range(20)]
+    distances = [hamming_distance(a, b) for i, a in enumerate(fingerprints) for b in fingerprints[i + 1:]]
+    assert min(distances) > 2 * MAX_HAMMING_DISTANCE
+
+def test_short_unrelated_stories_do_not_collide(tmp_path):
+    cache = StoryCache(str(tmp_path / 'story_cache.json'))
+    for seed in range(2000):
+        add(cache, article(seed, random.Random(seed).choice([8, 10, 15, 20])), f'https://example.com/{seed}')
+
+    for sentences in (8, 10, 12, 15):
+        queries = [article(seed, sentences) for seed in range(10000, 10200)]
+        assert not any(lookup(cache, text) for text in queries)
+        # The fingerprints alone, before the clause check, should hardly ever be near
+        near = 0
+        for text in queries:
+            query = fingerprint(text)
+            candidates = [entry for key in fingerprint_bands(query) for entry in cache.bands.get(key, ())]
+            near += any(hamming_distance(query, entry['_fingerprint']) <= MAX_HAMMING_DISTANCE for entry in candidates)
+        assert near <= 2
+
+def test_close_fingerprint_needs_shared_clauses(tmp_path):
+    cache = StoryCache(str(tmp_path / 'story_cache.json'))
+    entry = add(cache, article(1), 'https://a.example/story')
+    # Same fingerprint, but none of the clauses
+    assert cache.lookup(entry['_fingerprint'], clause_hashes(article(2))) is None
+
+def test_short_text_has_no_clauses():
+    assert clause_hashes('Spurs win. Kane scores twice.') is None
+    # Very short clauses are ignored, however many there are
+    assert clause_hashes(', '.join(['he said'] * 20)) is None
+
+def test_lookup_finds_near_copy_after_reload(tmp_path):
+    filename = str(tmp_path / 'story_cache.json')
+    text = article(2)
+    cache = StoryCache(filename)
+    add(cache, text, 'https://a.example/story', summary='Summary')
+    cache.save()
+
+    reloaded = StoryCache(filename)
+    story = lookup(reloaded, text + ' Read more on our site.')
+    assert story is not None and story['link'] == 'https://a.example/story' and story['summary'] == 'Summary'
+    assert lookup(reloaded, article(3)) is None
+
+def test_oldest_entries_evicted(tmp_path):
+    cache = StoryCache(str(tmp_path / 'story_cache.json'), max_entries=2)
+    texts = [article(seed) for seed in range(3)]
+    for seed, text in enumerate(texts):
+        add(cache, text, f'https://example.com/{seed}')
+    assert lookup(cache, texts[0]) is None
+    assert lookup(cache, texts[2]) is not None
@@ -0,0 +1,32 @@
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+import requests
+
+from metrics import METRICS
+from tottenham_scanner import ScannerRequestHandler
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), ScannerRequestHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}'
+    httpd.shutdown()
+    httpd.server_close()
+
+def test_metrics_endpoint_answers(server):
+    with METRICS.timer('check'):
+        pass
+    response = requests.get(server + '/metrics', timeout=5)
+    assert response.status_code == 200
+    assert response.headers['Content-Type'].startswith('text/plain')
+    assert 'stage="check"' in response.text
+
+def test_static_files_still_served(server, tmp_path):
+    (tmp_path / 'index.html').write_text('<html>hello</html>')
+    response = requests.get(server + '/index.html', timeout=5)
+    assert response.status_code == 200
+    assert 'hello' in response.text
@@ -0,0 +1,92 @@
+import os
+
+import pytest
+
+from images import ImageCache
+from story_cache import clause_hashes, story_fingerprint
+from workers import HashRing, SharedStore, SharedStoryCache
+
+STORY = ' '.join(f'Spurs agreed part {n} of the deal with the selling club, the agency said on day {n}.' for n in range(40))
+OTHER = ' '.join(f'Ange named an unchanged side for match {n}, the manager confirmed before game {n}.' for n in range(40))
+
+SOURCES = [f'source-{i}' for i in range(300)]
+
+def assignments(ring):
+    return {source: ring.node_for(source) for source in SOURCES}
+
+def test_ring_spreads_sources_over_workers():
+    counts = {}
+    for node in assignments(HashRing(['w0', 'w1', 'w2'])).values():
+        counts[node] = counts.get(node, 0) + 1
+    assert set(counts) == {'w0', 'w1', 'w2'}
+    assert min(counts.values()) > len(SOURCES) / 6
+
+def test_ring_moves_only_the_lost_workers_sources():
+    before = assignments(HashRing(['w0', 'w1', 'w2']))
+    after = assignments(HashRing(['w0', 'w2']))
+    moved = [source for source in SOURCES if before[source] != after[source]]
+    assert moved and all(before[source] == 'w1' for source in moved)
+
+def test_ring_is_independent_of_worker_order():
+    assert assignments(HashRing(['w0', 'w1', 'w2'])) == assignments(HashRing(['w2', 'w0', 'w1']))
+
+def test_empty_ring_has_no_node():
+    assert HashRing([]).node_for('source-0') is None
+
+def write_file(path, size):
+    with open(path, 'wb') as f:
+        f.write(b'x' * size)
+
+def test_worker_indexes_are_separate_and_survive_quota(tmp_path):
+    directory = str(tmp_path / 'thumbs')
+    worker = ImageCache(directory, quota_bytes=None, index_name='index_worker-0.json')
+    worker.thumbnails['https://example.com/a.jpg'] = {'jpeg': os.path.join(directory, 'a.jpg'), 'webp': None}
+    worker.save_index()
+    write_file(os.path.join(directory, 'a.jpg'), 600)
+    write_file(os.path.join(directory, 'b.jpg'), 600)
+    os.utime(os.path.join(directory, 'a.jpg'), (1, 1))
+
+    aggregator = ImageCache(directory, quota_bytes=1000)
+    assert aggregator.thumbnails == {}
+    aggregator.enforce_quota()
+
+    assert sorted(os.listdir(directory)) == ['b.jpg', 'index_worker-0.json']
+    assert ImageCache(directory, index_name='index_worker-0.json').thumbnails
+
+@pytest.fixture
+def stores(tmp_path):
+    stores = [SharedStore(str(tmp_path / 'scanner_shared.db')) for _ in range(2)]
+    yield stores
+    for store in stores:
+        store.close()
+
+def match(cache, text, link, source):
+    clauses = clause_hashes(text)
+    fingerprint = story_fingerprint(clauses)
+    return cache.lookup(fingerprint, clauses) or cache.add(fingerprint, clauses, link, source)
+
+def test_workers_share_stories(stores):
+    first, second = SharedStoryCache(stores[0]), SharedStoryCache(stores[1])
+    original = match(first, STORY, 'https://bbc.example/deal', 'BBC Sport')
+    first.set_summary(original, 'Spurs agree a deal.')
+
+    copy = match(second, 'LONDON (Agency) - ' + STORY, 'https://teamtalk.example/deal', 'TeamTalk')
+    assert copy['story_id'] == original['story_id'] and copy['link'] == 'https://bbc.example/deal'
+    assert copy['summary'] == 'Spurs agree a deal.'
+    assert match(second, OTHER, 'https://teamtalk.example/team', 'TeamTalk')['link'] == 'https://teamtalk.example/team'
+
+def test_add_returns_the_story_another_worker_stored_first(stores):
+    first, second = SharedStoryCache(stores[0]), SharedStoryCache(stores[1])
+    clauses = clause_hashes(STORY)
+    fingerprint = story_fingerprint(clauses)
+    # Both workers looked up before either added
+    assert first.lookup(fingerprint, clauses) is None and second.lookup(fingerprint, clauses) is None
+    original = first.add(fingerprint, clauses, 'https://bbc.example/deal', 'BBC Sport')
+    assert second.add(fingerprint, clauses, 'https://teamtalk.example/deal', 'TeamTalk')['story_id'] == original['story_id']
+
+def test_shared_stories_evicted_oldest_first(stores):
+    cache = SharedStoryCache(stores[0], max_entries=1)
+    match(cache, STORY, 'https://bbc.example/deal', 'BBC Sport')
+    match(cache, OTHER, 'https://bbc.example/team', 'BBC Sport')
+    assert [row[0] for row in stores[0].db.execute('SELECT link FROM stories')] == ['https://bbc.example/team']
+    assert stores[0].db.execute('SELECT COUNT(DISTINCT story_id) FROM story_bands').fetchone()[0] == 1
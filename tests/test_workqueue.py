@@ -0,0 +1,53 @@
+import pytest
+
+from workqueue import MAX_ATTEMPTS, WorkQueue
+
+JOB = {'source': 'SpursWeb', 'title': 'Maddison fit for Saturday', 'link': 'https://example.com/a'}
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = WorkQueue(str(tmp_path / 'work_queue.db'))
+    yield queue
+    queue.close()
+
+def test_checkpoints_survive_reopening(tmp_path, queue):
+    queue.add('a', JOB)
+    queue.add('b', dict(JOB, link='https://example.com/b'))
+    queue.checkpoint('a', 'extracted', dict(JOB, full_content='text'))
+    queue.close()
+
+    reopened = WorkQueue(str(tmp_path / 'work_queue.db'))
+    try:
+        assert 'a' in reopened and len(reopened) == 2
+        states = [(article_id, state) for article_id, state, _ in reopened.unfinished()]
+        assert states == [('a', 'extracted'), ('b', 'queued')]
+        assert reopened.unfinished()[0][2]['full_content'] == 'text'
+    finally:
+        reopened.close()
+
+def test_add_keeps_existing_checkpoint(queue):
+    queue.add('a', JOB)
+    queue.checkpoint('a', 'summarised', dict(JOB, summary='done'))
+    queue.add('a', JOB)
+    assert queue.unfinished() == [('a', 'summarised', dict(JOB, summary='done'))]
+
+def test_complete_removes_jobs(queue):
+    queue.add('a', JOB)
+    queue.complete(['a'])
+    assert 'a' not in queue and queue.unfinished() == []
+
+def test_unknown_state_rejected(queue):
+    queue.add('a', JOB)
+    with pytest.raises(ValueError):
+        queue.checkpoint('a', 'published', JOB)
+
+def test_job_given_up_after_max_attempts(queue):
+    queue.add('a', JOB)
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        assert queue.start_attempt('a') == attempt
+        given_up = queue.record_error('a', RuntimeError('boom'), attempt)
+        assert given_up == (attempt == MAX_ATTEMPTS)
+    assert queue.unfinished() == []
+    # Still known, so the feed item is not accepted again
+    assert 'a' in queue
+    assert queue.failed() == [('a', JOB, 'boom')]
@@ -1,12 +1,24 @@
 import requests
 import xml.etree.ElementTree as ET
-from bs4 import BeautifulSoup
 import re
+import html
 import time
 import json
 import hashlib
 from datetime import datetime
 import os
+from concurrent.futures import ProcessPoolExecutor
+
+from article import Article, read_binary, write_binary
+from health import HealthTracker
+from images import ImageCache
+from metrics import METRICS
+from profiler import CycleProfiler
+from relevance import RelevanceClassifier
+from search_index import DEFAULT_LIMIT as DEFAULT_SEARCH_LIMIT, SEARCH_INDEX_FILE, SearchIndex
+from sources import DEFAULT_EXTRACTION_PROFILE, SourceRegistry
+from story_cache import StoryCache, clause_hashes, story_fingerprint
+from workqueue import MAX_ATTEMPTS, WorkQueue
 
 def parse_rss_date(date_string):
     """Parse various RSS date formats"""
@@ -37,62 +49,261 @@ def parse_rss_date(date_string):
     
     return None
 
+# Tags, allowing '>' inside quoted attribute values
+HTML_TAG_RE = re.compile(r'<(?:[^>"\']|"[^"]*"|\'[^\']*\')*>')
+HEALTH_FOOTER_RE = re.compile(r'<footer class="source-health">.*?</footer>', re.DOTALL)
+PAGE_FILE_RE = re.compile(r'page-(\d+)\.html$')
+
+def strip_html(text):
+    """Plain text of a short HTML fragment such as a feed description"""
+    if '<' in text:
+        text = HTML_TAG_RE.sub('', text)
+    if '&' in text:
+        text = html.unescape(text)
+    return text
+
+FALLBACK_SUMMARY = "Read the full article for complete details on this Tottenham story."
+
+SUMMARY_KEYWORDS = ('tottenham', 'spurs', 'thfc', 'postecoglou', 'ange', 'levy', 'son', 'kane')
+SUMMARY_ACTION_WORDS = ('sign', 'buy', 'sell', 'target', 'win', 'lose', 'beat', 'defeat', 'transfer')
+
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+
+# Website clutter removed before sentence selection, paired with the literal
+# each pattern starts with so articles without it skip the regex pass.
+SUMMARY_CLUTTER_PATTERNS = tuple(
+    (literal.casefold(), re.compile(re.escape(literal) + r'.*?(?=\.|$)', re.IGNORECASE))
+    for literal in ['READ MORE:', 'CLICK HERE', 'Sign up', 'Subscribe']
+)
+# re.IGNORECASE also matches these against "i", but casefold() does not
+# map them to a plain "i", so their presence disables the literal shortcut.
+CASEFOLD_UNSAFE_CHARS = ('\u0130', '\u0131')
+
+def collapse_whitespace(text):
+    r"""Equivalent to re.sub(r'\s+', ' ', text).strip(), without a regex pass"""
+    return ' '.join(text.split())
+
+def strip_summary_clutter(text):
+    if any(char in text for char in CASEFOLD_UNSAFE_CHARS):
+        folded = None
+    else:
+        folded = text.casefold()
+    for literal, pattern in SUMMARY_CLUTTER_PATTERNS:
+        if folded is None or literal in folded:
+            text = pattern.sub('', text)
+    return text
+
+def score_sentence_terms(sentence):
+    """Keyword hits score 5 per occurrence, action words 3 once per sentence"""
+    sentence_lower = sentence.lower()
+    return (5 * sum(map(sentence_lower.count, SUMMARY_KEYWORDS)) +
+            3 * sum(map(sentence_lower.__contains__, SUMMARY_ACTION_WORDS)))
+
+# Below this many articles per worker, process start-up costs more than it saves
+SUMMARY_BATCH_MIN_PER_PROCESS = 8
+
+def create_smart_summary(title, full_text):
+    """Create a smart summary using keyword-based sentence selection"""
+    if not full_text or len(full_text) < 200:
+        return FALLBACK_SUMMARY
+    
+    clean_text = collapse_whitespace(full_text)
+    
+    # Remove common website clutter
+    clean_text = strip_summary_clutter(clean_text)
+    
+    sentences = SENTENCE_SPLIT_RE.split(clean_text)
+    sentences = [s for s in map(str.strip, sentences) if 30 < len(s) < 300]
+    
+    if not sentences:
+        return FALLBACK_SUMMARY
+    
+    scored_sentences = []
+    for i, sentence in enumerate(sentences[:15]):
+        score = score_sentence_terms(sentence)
+        
+        score += (15 - i) * 0.5
+        
+        if len(sentence) > 200:
+            score -= 2
+        
+        if score > 0:
+            scored_sentences.append((score, sentence, i))
+    
+    if not scored_sentences:
+        return FALLBACK_SUMMARY
+    
+    scored_sentences.sort(key=lambda x: -x[0])
+    
+    summary_parts = []
+    total_length = 0
+    target_length = 380
+    
+    for score, sentence, position in scored_sentences:
+        sentence_length = len(sentence)
+        
+        if total_length + sentence_length > target_length:
+            if total_length < 200:
+                remaining_space = target_length - total_length
+                if remaining_space > 50:
+                    truncated = sentence[:remaining_space].strip()
+                    last_space = truncated.rfind(' ')
+                    if last_space > remaining_space * 0.7:
+                        truncated = truncated[:last_space] + '...'
+                        summary_parts.append(truncated)
+                        break
+            else:
+                break
+        else:
+            summary_parts.append(sentence)
+            total_length += sentence_length
+            
+            if total_length >= 250:
+                break
+    
+    if not summary_parts:
+        for score, sentence, position in scored_sentences[:3]:
+            if len(sentence) <= 400:
+                return sentence
+        return FALLBACK_SUMMARY
+    
+    summary = ' '.join(summary_parts)
+    summary = collapse_whitespace(summary)
+    
+    if summary and not summary.endswith(('.', '!', '?', '...')):
+        summary += '.'
+    
+    return summary if len(summary) > 50 else FALLBACK_SUMMARY
+
+def create_smart_summaries(articles, processes=None):
+    """Batch entry point for create_smart_summary over (title, full_text) pairs.
+    
+    Results come back in input order and match the single-article output.
+    Small batches, or processes=1, run in-process; larger ones are spread
+    over a process pool (processes=None uses every core).
+    """
+    articles = list(articles)
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = min(processes, len(articles) // SUMMARY_BATCH_MIN_PER_PROCESS)
+    
+    if processes <= 1:
+        return [create_smart_summary(title, full_text) for title, full_text in articles]
+    
+    titles = [title for title, _ in articles]
+    texts = [full_text for _, full_text in articles]
+    chunksize = max(1, len(articles) // (processes * 4))
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return list(pool.map(create_smart_summary, titles, texts, chunksize=chunksize))
+
 class TottenhamAIScanner:
-    def __init__(self):
-        self.primary_keywords = ['tottenham', 'spurs', 'thfc']
-        self.cutoff_date = datetime(2025, 6, 1, 0, 0, 0)
-        
-        self.feeds = {
-            'BBC Sport': {
-                'url': 'http://feeds.bbci.co.uk/sport/football/rss.xml',
-                'homepage': 'https://www.bbc.com/sport/football'
-            },
-            'Guardian Football': {
-                'url': 'https://www.theguardian.com/football/rss',
-                'homepage': 'https://www.theguardian.com/football'
-            },
-            'Sky Sports': {
-                'url': 'https://www.skysports.com/rss/12040',
-                'homepage': 'https://www.skysports.com/football'
-            },
-            'Mirror Football': {
-                'url': 'https://www.mirror.co.uk/sport/football/rss.xml',
-                'homepage': 'https://www.mirror.co.uk/sport/football'
-            },
-            'TeamTalk': {
-                'url': 'https://www.teamtalk.com/feed',
-                'homepage': 'https://www.teamtalk.com'
-            },
-            'Football365': {
-                'url': 'https://www.football365.com/feed',
-                'homepage': 'https://www.football365.com'
-            },
-            'Football Insider': {
-                'url': 'https://www.footballinsider247.com/feed/',
-                'homepage': 'https://www.footballinsider247.com'
-            },
-            'Tottenham Official': {
-                'url': 'https://www.tottenhamhotspur.com/news/feed/',
-                'homepage': 'https://www.tottenhamhotspur.com/news'
-            },
-            'TottenhamHotspurNews': {
-                'url': 'https://www.tottenhamhotspurnews.com/feed/',
-                'homepage': 'https://www.tottenhamhotspurnews.com'
-            },
-            'SpursWeb': {
-                'url': 'https://www.spurs-web.com/feed/',
-                'homepage': 'https://www.spurs-web.com'
-            },
-            'To The Lane And Back': {
-                'url': 'https://tothelaneandback.com/feed/',
-                'homepage': 'https://tothelaneandback.com'
-            }
-        }
+    def __init__(self, config_file=None):
+        self.registry = SourceRegistry(config_file)
+        settings = self.registry.settings
+        self.primary_keywords = settings['keywords']
+        self.cutoff_date = settings['cutoff_date']
+        self.feeds = self.registry.feeds
+        self.extraction_profiles = self.registry.extraction_profiles
         
         self.seen_articles_file = 'seen_articles.json'
-        self.seen_articles = self.load_seen_articles()
+        # These stores are opened on first use, see their properties
+        self._seen_articles = None
+        self._story_cache = None
+        self.work_queue_file = 'work_queue.db'
+        self._work_queue = None
+        self.search_index_file = SEARCH_INDEX_FILE
+        self._search_index = None
+        self._image_cache = None
+        self.health = HealthTracker()
+        self.relevance = RelevanceClassifier(self.feeds, self.primary_keywords)
         self.html_filename = 'index.html'
-        self.is_initial_scan = not os.path.exists('articles_data.json')
+        # Footer on the pages as last written, to spot health changes between saves
+        self.rendered_health_footer = None
+        self.status_filename = 'status.json'
+        # Number of the archive page holding the oldest articles, see oldest_page
+        self._oldest_page = None
+        self.articles_file = 'articles_data.json'
+        self.articles_binary_file = 'articles_data.bin'
+        # Saved articles as Article records, kept between saves once loaded
+        self._articles = None
+        self.articles_per_page = settings['articles_per_page']
+        self.history_limit = settings['history_limit']
+        # Feed items examined per source on the initial deep scan and afterwards
+        self.initial_items_to_check = settings['initial_items_to_check']
+        self.items_to_check = settings['items_to_check']
+        # Pause between article fetches, in seconds, to stay polite to each site
+        self.initial_request_delay = settings['initial_request_delay']
+        self.request_delay = settings['request_delay']
+        # Seconds between scan cycles; a source's own poll_interval can only be longer
+        self.poll_interval = settings['poll_interval']
+        # Source name -> time.monotonic() of its last check
+        self.last_polled = {}
+        self.is_initial_scan = not os.path.exists(self.articles_file)
+    
+    @property
+    def seen_articles(self):
+        if self._seen_articles is None:
+            self._seen_articles = self.load_seen_articles()
+        return self._seen_articles
+    
+    @seen_articles.setter
+    def seen_articles(self, value):
+        self._seen_articles = value
+    
+    @property
+    def story_cache(self):
+        if self._story_cache is None:
+            self._story_cache = StoryCache()
+        return self._story_cache
+    
+    @story_cache.setter
+    def story_cache(self, value):
+        self._story_cache = value
+    
+    @property
+    def image_cache(self):
+        if self._image_cache is None:
+            self._image_cache = ImageCache()
+        return self._image_cache
+    
+    @image_cache.setter
+    def image_cache(self, value):
+        self._image_cache = value
+    
+    @property
+    def work_queue(self):
+        if self._work_queue is None:
+            self._work_queue = WorkQueue(self.work_queue_file)
+        return self._work_queue
+    
+    @work_queue.setter
+    def work_queue(self, value):
+        self._work_queue = value
+    
+    @property
+    def search_index(self):
+        if self._search_index is None:
+            self._search_index = SearchIndex(self.search_index_file)
+        return self._search_index
+    
+    @property
+    def oldest_page(self):
+        if self._oldest_page is None:
+            self._oldest_page = self.load_status().get('oldest_page', 1)
+        return self._oldest_page
+    
+    @oldest_page.setter
+    def oldest_page(self, value):
+        self._oldest_page = value
+    
+    def load_status(self):
+        if os.path.exists(self.status_filename):
+            try:
+                with open(self.status_filename, 'r') as f:
+                    return json.load(f)
+            except:
+                return {}
+        return {}
     
     def is_article_after_cutoff(self, date_string):
         if not date_string:
@@ -115,6 +326,8 @@ class TottenhamAIScanner:
         return {}
     
     def save_seen_articles(self):
+        if self._seen_articles is None:
+            return
         with open(self.seen_articles_file, 'w') as f:
             json.dump(self.seen_articles, f, indent=2)
     
@@ -129,17 +342,8 @@ class TottenhamAIScanner:
             return parsed_date.strftime('%d %B %Y, %H:%M')
         return date_string
     
-    def extract_article_image(self, soup, url):
+    def extract_article_image(self, soup, url, image_selectors=DEFAULT_EXTRACTION_PROFILE['image_selectors']):
         try:
-            image_selectors = [
-                'meta[property="og:image"]',
-                'meta[name="twitter:image"]',
-                '.article-image img',
-                '.featured-image img',
-                '.post-thumbnail img',
-                'article img:first-of-type'
-            ]
-            
             for selector in image_selectors:
                 if 'meta' in selector:
                     element = soup.select_one(selector)
@@ -175,54 +379,20 @@ class TottenhamAIScanner:
         return urljoin(base_url, img_url)
     
     def is_primary_tottenham_story(self, title, description, full_content="", source_name=""):
-        all_text = (title + " " + description + " " + full_content[:500]).lower()
-        
-        tottenham_sources = ['tottenhamhotspurnews', 'spurs-web', 'tothelaneandback', 'football.london']
-        is_tottenham_source = any(source in source_name.lower() for source in tottenham_sources)
-        
-        if is_tottenham_source:
-            return True
-        
-        primary_count = sum(all_text.count(keyword) for keyword in self.primary_keywords)
-        if primary_count >= 1:
-            return True
-        
-        return False
+        return self.relevance.is_relevant(source_name, title, description, full_content)
     
-    def extract_full_article(self, url):
+    def extract_full_article(self, url, extraction=None):
         try:
             headers = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'}
             
             print('      🔍 Accessing: ' + url[:60] + '...')
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            image_url = self.extract_article_image(soup, url)
-            
-            for element in soup(['script', 'style', 'nav', 'header', 'footer']):
-                element.decompose()
+            with METRICS.timer('article_fetch'):
+                response = requests.get(url, headers=headers, timeout=15)
+                response.raise_for_status()
+            METRICS.add_bytes(len(response.content), 'article')
             
-            text_selectors = [
-                '.entry-content p', '.article-body p', '.story-body p',
-                '.content p', 'article p', 'main p'
-            ]
-            
-            article_text = ""
-            for selector in text_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    text_parts = [elem.get_text(strip=True) for elem in elements if len(elem.get_text(strip=True)) > 20]
-                    if text_parts:
-                        article_text = ' '.join(text_parts)
-                        break
-            
-            if len(article_text) < 100:
-                paragraphs = soup.find_all('p')
-                text_parts = [p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 15]
-                article_text = ' '.join(text_parts)
-            
-            article_text = self.clean_text(article_text)
+            with METRICS.timer('article_parse'):
+                article_text, image_url = self.parse_article_html(response.content, url, extraction)
             print('      📄 ' + str(len(article_text)) + ' chars')
             if image_url:
                 print('      🖼️  Image found')
@@ -233,265 +403,567 @@ class TottenhamAIScanner:
             print('      ⚠️  Error: ' + str(e))
             return "", None
     
+    def parse_article_html(self, content, url, extraction=None):
+        """Main text and lead image URL from an article page, using the named extraction profile"""
+        # Imported here so start-up, and summary worker processes, skip loading bs4
+        from bs4 import BeautifulSoup
+        profile = self.extraction_profiles[extraction or 'default']
+        soup = BeautifulSoup(content, 'html.parser')
+        image_url = self.extract_article_image(soup, url, profile['image_selectors'])
+        
+        for element in soup(['script', 'style', 'nav', 'header', 'footer']):
+            element.decompose()
+        
+        article_text = ""
+        for selector in profile['text_selectors']:
+            elements = soup.select(selector)
+            if elements:
+                text_parts = [elem.get_text(strip=True) for elem in elements if len(elem.get_text(strip=True)) > 20]
+                if text_parts:
+                    article_text = ' '.join(text_parts)
+                    break
+        
+        if len(article_text) < 100:
+            paragraphs = soup.find_all('p')
+            text_parts = [p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 15]
+            article_text = ' '.join(text_parts)
+        
+        return self.clean_text(article_text), image_url
+    
     def clean_text(self, text):
         if not text:
             return ""
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        return collapse_whitespace(text)
     
     def create_smart_summary(self, title, full_text, url):
         """Create a smart summary using keyword-based sentence selection"""
-        if not full_text or len(full_text) < 200:
-            return "Read the full article for complete details on this Tottenham story."
-        
-        clean_text = re.sub(r'\s+', ' ', full_text).strip()
-        
-        # Remove common website clutter
-        cleanup_patterns = [
-            r'READ MORE:.*?(?=\.|$)',
-            r'CLICK HERE.*?(?=\.|$)',
-            r'Sign up.*?(?=\.|$)',
-            r'Subscribe.*?(?=\.|$)',
-        ]
-        
-        for pattern in cleanup_patterns:
-            clean_text = re.sub(pattern, '', clean_text, flags=re.IGNORECASE)
-        
-        sentences = re.split(r'(?<=[.!?])\s+(?=[A-Z])', clean_text)
-        sentences = [s.strip() for s in sentences if len(s.strip()) > 30 and len(s.strip()) < 300]
-        
-        if not sentences:
-            return "Read the full article for complete details on this Tottenham story."
-        
-        tottenham_keywords = ['tottenham', 'spurs', 'thfc', 'postecoglou', 'ange', 'levy', 'son', 'kane']
-        action_words = ['sign', 'buy', 'sell', 'target', 'win', 'lose', 'beat', 'defeat', 'transfer']
-        
-        scored_sentences = []
-        for i, sentence in enumerate(sentences[:15]):
-            score = 0
-            sentence_lower = sentence.lower()
-            
-            for keyword in tottenham_keywords:
-                score += sentence_lower.count(keyword) * 5
-            
-            for word in action_words:
-                if word in sentence_lower:
-                    score += 3
-            
-            score += (15 - i) * 0.5
-            
-            if len(sentence) > 200:
-                score -= 2
-            
-            if score > 0:
-                scored_sentences.append((score, sentence, i))
-        
-        if not scored_sentences:
-            return "Read the full article for complete details on this Tottenham story."
-        
-        scored_sentences.sort(key=lambda x: -x[0])
-        
-        summary_parts = []
-        total_length = 0
-        target_length = 380
-        
-        for score, sentence, position in scored_sentences:
-            sentence_length = len(sentence)
-            
-            if total_length + sentence_length > target_length:
-                if total_length < 200:
-                    remaining_space = target_length - total_length
-                    if remaining_space > 50:
-                        truncated = sentence[:remaining_space].strip()
-                        last_space = truncated.rfind(' ')
-                        if last_space > remaining_space * 0.7:
-                            truncated = truncated[:last_space] + '...'
-                            summary_parts.append(truncated)
-                            break
-                else:
-                    break
-            else:
-                summary_parts.append(sentence)
-                total_length += sentence_length
-                
-                if total_length >= 250:
-                    break
-        
-        if not summary_parts:
-            for score, sentence, position in scored_sentences[:3]:
-                if len(sentence) <= 400:
-                    return sentence
-            return "Read the full article for complete details on this Tottenham story."
-        
-        summary = ' '.join(summary_parts)
-        summary = re.sub(r'\s+', ' ', summary).strip()
+        return create_smart_summary(title, full_text)
+    
+    def create_smart_summaries(self, articles):
+        """Summarise (title, full_text) pairs, across cores on the initial deep scan"""
+        processes = None if self.is_initial_scan else 1
+        return create_smart_summaries(articles, processes)
+    
+    def match_story(self, link, source_name, full_content, image_url):
+        """Find or register the story this article's text belongs to.
         
-        if summary and not summary.endswith(('.', '!', '?', '...')):
-            summary += '.'
+        Returns the story cache entry, or None when the text is too short to
+        fingerprint. An entry whose link differs from this one means the
+        article is a syndicated repeat of an earlier story.
+        """
+        clauses = clause_hashes(full_content) if full_content else None
+        if clauses is None:
+            return None
         
-        return summary if len(summary) > 50 else "Read the full article for complete details on this Tottenham story."
+        fingerprint = story_fingerprint(clauses)
+        story = self.story_cache.lookup(fingerprint, clauses)
+        if story is not None:
+            if story['link'] != link:
+                print('      ♻️  Same story as ' + story['source'])
+            return story
+        return self.story_cache.add(fingerprint, clauses, link, source_name, image_url)
     
     def check_for_articles(self):
-        new_articles = []
-        items_to_check = 25 if self.is_initial_scan else 15
+        # Articles left unfinished by a crash or restart come first
+        pending_articles, new_articles = self.resume_jobs()
+        now = time.monotonic()
         
         for source_name, source_info in self.feeds.items():
-            try:
-                print('🔍 Checking ' + source_name + f' (scanning {items_to_check} items)...')
-                response = requests.get(source_info['url'], timeout=15)
-                
+            if not self.is_source_due(source_name, source_info, now):
+                continue
+            if not self.health.should_poll(source_name):
+                failures = self.health.state(source_name)['consecutive_failures']
+                print(f'⏸️  Skipping {source_name} ({failures} failures in a row)')
+                continue
+            self.last_polled[source_name] = now
+            items_to_check = self.source_setting(source_info, 'items_to_check')
+            request_delay = self.source_setting(source_info, 'request_delay')
+            
+            with METRICS.timer('source', source_name):
+                feed_ok = False
                 try:
-                    root = ET.fromstring(response.content)
-                except ET.ParseError:
-                    print('   ⚠️  RSS error')
-                    continue
-                
-                items = root.findall('.//item')
-                source_count = 0
-                
-                for item in items[:items_to_check]:
-                    title = item.find('title')
-                    title = title.text if title is not None and title.text else ''
+                    if self.health.is_probe(source_name):
+                        print('🩺 Probing ' + source_name + '...')
+                    print('🔍 Checking ' + source_name + f' (scanning {items_to_check} items)...')
+                    fetch_start = time.perf_counter()
+                    with METRICS.timer('feed_fetch'):
+                        response = requests.get(source_info['url'], timeout=self.health.timeout(source_name))
+                        response.raise_for_status()
+                    fetch_latency = time.perf_counter() - fetch_start
+                    METRICS.add_bytes(len(response.content), 'feed')
                     
-                    link = item.find('link')
-                    link = link.text if link is not None and link.text else ''
-                    
-                    desc = item.find('description')
-                    desc_text = desc.text if desc is not None and desc.text else ''
-                    
-                    pub_date = None
-                    pub_date_raw = None
-                    for date_tag in ['pubDate', 'published', 'dc:date']:
-                        date_elem = item.find(date_tag)
-                        if date_elem is not None and date_elem.text:
-                            pub_date_raw = date_elem.text
-                            pub_date = self.parse_article_date(date_elem.text)
-                            break
-                    
-                    if pub_date_raw and not self.is_article_after_cutoff(pub_date_raw):
+                    try:
+                        with METRICS.timer('feed_parse'):
+                            root = ET.fromstring(response.content)
+                    except ET.ParseError:
+                        print('   ⚠️  RSS error')
+                        self.health.record_failure(source_name, 'malformed feed XML')
                         continue
+                    feed_ok = True
+                    self.health.record_success(source_name, fetch_latency)
                     
-                    if desc_text:
-                        desc_soup = BeautifulSoup(desc_text, 'html.parser')
-                        desc_text = desc_soup.get_text()
-                    
-                    if not link or not title:
-                        continue
+                    items = root.findall('.//item')
+                    source_count = 0
                     
-                    tottenham_sources = ['tottenhamhotspurnews', 'spurs-web', 'tothelaneandback', 'tottenhamhotspur.com']
-                    is_tottenham_source = any(source in source_name.lower() for source in tottenham_sources)
-                    
-                    if not is_tottenham_source:
-                        search_text = (title + ' ' + desc_text).lower()
-                        has_tottenham = any(keyword in search_text for keyword in self.primary_keywords)
+                    for item in items[:items_to_check]:
+                        # Cheapest checks first: seen items and old items never
+                        # need their description cleaned or scored.
+                        title = item.findtext('title') or ''
+                        link = item.findtext('link') or ''
+                        if not link or not title:
+                            continue
                         
-                        if not has_tottenham:
+                        article_id = self.get_article_id(link)
+                        if article_id in self.seen_articles or article_id in self.work_queue:
                             continue
+                        
+                        pub_date_raw = None
+                        for date_tag in ['pubDate', 'published', 'dc:date']:
+                            pub_date_raw = item.findtext(date_tag)
+                            if pub_date_raw:
+                                break
+                        
+                        parsed_date = parse_rss_date(pub_date_raw)
+                        if parsed_date and parsed_date < self.cutoff_date:
+                            continue
+                        pub_date = parsed_date.strftime('%d %B %Y, %H:%M') if parsed_date else (pub_date_raw or None)
+                        
+                        desc_text = strip_html(item.findtext('description') or '')
+                        
+                        if not self.is_primary_tottenham_story(title, desc_text, "", source_name):
+                            continue
+                        
+                        print('   ✅ ACCEPT: ' + title[:50] + '...')
+                        
+                        job = {
+                            'source': source_name,
+                            'source_homepage': source_info['homepage'],
+                            'title': title,
+                            'link': link,
+                            'image_url': None,
+                            'thumbnail': None,
+                            'published_date': pub_date
+                        }
+                        self.work_queue.add(article_id, job)
+                        self.seen_articles[article_id] = {
+                            'title': title,
+                            'found_at': datetime.now().isoformat()
+                        }
+                        
+                        pending_articles.append(self.extract_job(article_id, job))
+                        source_count += 1
+                        
+                        time.sleep(request_delay)
                     
-                    if not self.is_primary_tottenham_story(title, desc_text, "", source_name):
-                        if not is_tottenham_source:
-                            print('   ⏭️  Skip: ' + title[:50] + '...')
-                        continue
-                    
-                    article_id = self.get_article_id(link)
-                    if article_id in self.seen_articles:
-                        continue
-                    
-                    print('   ✅ ACCEPT: ' + title[:50] + '...')
-                    
-                    full_content, image_url = self.extract_full_article(link)
-                    
-                    print('      📝 Creating smart summary...')
-                    smart_summary = self.create_smart_summary(title, full_content, link)
-                    print(f'      ✨ Summary: {smart_summary[:100]}...')
-                    
-                    article_data = {
-                        'source': source_name,
-                        'source_homepage': source_info['homepage'],
-                        'title': title,
-                        'summary': smart_summary,
-                        'link': link,
-                        'image_url': image_url,
-                        'published_date': pub_date,
-                        'chars': len(smart_summary),
-                        'has_full_content': bool(full_content and len(full_content) > 100),
-                        'content_length': len(full_content) if full_content else 0,
-                        'found_at': datetime.now().isoformat()
-                    }
-                    
-                    new_articles.append(article_data)
-                    source_count += 1
-                    
-                    self.seen_articles[article_id] = {
-                        'title': title,
-                        'found_at': datetime.now().isoformat()
-                    }
+                    print('   🎯 ' + str(source_count) + ' stories from ' + source_name)
                     
-                    print('   💾 Saved!')
-                    time.sleep(1 if self.is_initial_scan else 2)
-                
-                print('   🎯 ' + str(source_count) + ' stories from ' + source_name)
-                
+                except Exception as e:
+                    print('   ❌ Error: ' + str(e))
+                    # Errors after the feed was read are ours, not the source's
+                    if not feed_ok:
+                        self.health.record_failure(source_name, e)
+        
+        # Only the first copy of each story is summarised; syndicated repeats,
+        # whether from earlier cycles or this one, reuse its summary. A repeat
+        # resumed after a crash may belong to a story that never got one.
+        pending_links = {pending['link'] for pending in pending_articles}
+        to_summarise = [
+            pending for pending in pending_articles
+            if pending['story'] is None or pending['story']['link'] == pending['link']
+            or (pending['story']['summary'] is None and pending['story']['link'] not in pending_links)
+        ]
+        if to_summarise:
+            print(f'📝 Creating smart summaries for {len(to_summarise)} articles...')
+            with METRICS.timer('summary'):
+                try:
+                    summaries = self.create_smart_summaries(
+                        (pending['title'], pending['full_content']) for pending in to_summarise
+                    )
+                except Exception:
+                    # Find the article that broke the batch; the rest still get summaries
+                    summaries = [self.summarise_pending(pending) for pending in to_summarise]
+            for pending, smart_summary in zip(to_summarise, summaries):
+                pending['summary'] = smart_summary
+                if pending['story'] is not None:
+                    self.story_cache.set_summary(pending['story'], smart_summary)
+        
+        for pending in pending_articles:
+            article_id = pending.pop('article_id')
+            try:
+                new_articles.append(self.finish_article(article_id, pending))
             except Exception as e:
-                print('   ❌ Error: ' + str(e))
+                # Left in the work queue at its last checkpoint, for the next resume
+                self.record_job_error(article_id, pending, e)
         
         return new_articles
     
+    def summarise_pending(self, pending):
+        """Summary of one pending article, or None if summarising it raises"""
+        try:
+            return create_smart_summary(pending['title'], pending['full_content'])
+        except Exception as e:
+            print(f'   ❌ Could not summarise {pending["title"][:40]}...: {e}')
+            return None
+    
+    def finish_article(self, article_id, pending):
+        """Turn a summarised pending article into its record, index it and checkpoint it"""
+        full_content = pending.pop('full_content')
+        story = pending.pop('story')
+        smart_summary = pending.pop('summary', None)
+        if smart_summary is None:
+            if story is None or story['summary'] is None:
+                raise ValueError('no summary for this article or its story')
+            smart_summary = story['summary']
+            print(f'   ♻️  {pending["title"][:40]}... reused summary from {story["source"]}')
+        else:
+            print(f'   ✨ {pending["title"][:40]}... {smart_summary[:80]}...')
+        
+        article_data = dict(pending)
+        article_data.update({
+            'summary': smart_summary,
+            'chars': len(smart_summary),
+            'has_full_content': bool(full_content and len(full_content) > 100),
+            'content_length': len(full_content) if full_content else 0,
+            'found_at': datetime.now().isoformat()
+        })
+        with METRICS.timer('index', article_data['source']):
+            self.search_index.add(article_data, full_content)
+        article = Article.from_dict(article_data)
+        self.work_queue.checkpoint(article_id, 'summarised', article_data)
+        return article
+    
+    def extract_job(self, article_id, job):
+        """Fetch and parse a queued article, checkpointing the result.
+        
+        Returns the job as a pending article, with its full text and story.
+        """
+        source_info = self.feeds.get(job['source'], {})
+        with METRICS.timer('extract', job['source']):
+            full_content, image_url = self.extract_full_article(job['link'], source_info.get('extraction'))
+        story = self.match_story(job['link'], job['source'], full_content, image_url)
+        if not image_url and story:
+            image_url = story['image_url']
+        
+        with METRICS.timer('thumbnail', job['source']):
+            thumbnail = self.image_cache.thumbnail(image_url)
+        if thumbnail is None and self.image_cache.is_rejected(image_url):
+            image_url = None
+        
+        job.update({
+            'image_url': image_url,
+            'thumbnail': thumbnail,
+            'story_id': story['story_id'] if story else None,
+            'full_content': full_content
+        })
+        self.work_queue.checkpoint(article_id, 'extracted', job)
+        return dict(job, article_id=article_id, story=story)
+    
+    def resume_jobs(self):
+        """Pending articles and finished article records left in the work queue"""
+        jobs = self.work_queue.unfinished()
+        if not jobs:
+            return [], []
+        
+        print(f'♻️  Resuming {len(jobs)} unfinished articles from the work queue')
+        pending_articles = []
+        finished_articles = []
+        for article_id, state, job in jobs:
+            # seen_articles.json is only saved after a cycle, so it may not have these yet
+            if article_id not in self.seen_articles:
+                self.seen_articles[article_id] = {
+                    'title': job['title'],
+                    'found_at': datetime.now().isoformat()
+                }
+            
+            attempt = self.work_queue.start_attempt(article_id)
+            if attempt > MAX_ATTEMPTS:
+                # Every earlier attempt died without recording an error
+                self.work_queue.record_error(article_id, 'scanner stopped while working on it', attempt)
+                print(f'   🪦 Gave up on {job["title"][:40]}... after {MAX_ATTEMPTS} attempts')
+                continue
+            try:
+                if state == 'queued':
+                    pending_articles.append(self.extract_job(article_id, job))
+                elif state == 'extracted':
+                    # The story cache may not have been saved, so match the text again
+                    story = self.match_story(job['link'], job['source'], job['full_content'], job['image_url'])
+                    pending_articles.append(dict(
+                        job, article_id=article_id, story=story, story_id=story['story_id'] if story else None
+                    ))
+                else:
+                    finished_articles.append(Article.from_dict(job))
+            except Exception as e:
+                self.record_job_error(article_id, job, e, attempt)
+        return pending_articles, finished_articles
+    
+    def record_job_error(self, article_id, job, error, attempt=0):
+        """Report a job that raised; it is retried on a later resume until MAX_ATTEMPTS"""
+        print(f'   ❌ {job["title"][:40]}... failed: {error}')
+        if self.work_queue.record_error(article_id, error, attempt):
+            print(f'   🪦 Gave up on it after {MAX_ATTEMPTS} attempts')
+    
+    def backfill_search_index(self, articles):
+        """Index articles saved before search existed; their extracted text is gone"""
+        print(f'🔎 Indexing {len(articles)} saved articles for search')
+        # Saved articles are newest first, and the index returns the latest added first
+        self.search_index.add_many((article.to_dict(), '') for article in reversed(articles))
+        self.search_index.optimize()
+    
+    def source_setting(self, source_info, name):
+        """A source's own value for a scan setting, or the scanner-wide one"""
+        if self.is_initial_scan:
+            name = 'initial_' + name
+        return source_info.get(name, getattr(self, name))
+    
+    def is_source_due(self, source_name, source_info, now):
+        """Whether a source's poll_interval has passed since it was last checked"""
+        last_polled = self.last_polled.get(source_name)
+        if self.is_initial_scan or last_polled is None:
+            return True
+        return now - last_polled >= source_info.get('poll_interval', self.poll_interval)
+    
     def load_existing_articles(self):
         if not os.path.exists(self.html_filename):
             return []
+        if self._articles is not None:
+            return self._articles
         
-        try:
-            with open('articles_data.json', 'r') as f:
-                data = json.load(f)
-                return data.get('articles', [])
-        except:
-            return []
+        # The binary copy is written after the JSON, so an older one means the JSON was edited since
+        articles = None
+        if os.path.exists(self.articles_binary_file) and os.path.exists(self.articles_file):
+            if os.path.getmtime(self.articles_binary_file) >= os.path.getmtime(self.articles_file):
+                articles = read_binary(self.articles_binary_file)
+        if articles is None:
+            try:
+                with open(self.articles_file, 'r') as f:
+                    data = json.load(f)
+                articles = [Article.from_dict(article) for article in data.get('articles', [])]
+            except:
+                return []
+        self._articles = articles
+        return articles
     
     def save_all_articles(self, new_articles):
         existing_articles = self.load_existing_articles()
         all_articles = new_articles + existing_articles
         
-        seen_links = set()
-        unique_articles = []
+        # A re-fetched link replaces its saved record
+        latest = {}
         for article in all_articles:
-            if article['link'] not in seen_links:
-                unique_articles.append(article)
-                seen_links.add(article['link'])
+            latest.setdefault(article.link, article)
         
-        def get_sort_date(article):
-            pub_date = article.get('published_date')
-            if pub_date:
-                try:
-                    return datetime.strptime(pub_date, '%d %B %Y, %H:%M')
-                except:
-                    pass
+        # Group syndicated copies of the same story under one card. The
+        # earliest copy keeps the card, so a repeat found in a later cycle
+        # joins it instead of taking its place at the top of the page.
+        copy_links = set()
+        stories = {}
+        unique_articles = []
+        for article in sorted(latest.values(), key=lambda article: article.found_at or ''):
+            if article.link in copy_links:
+                continue
             
-            found_at = article.get('found_at')
-            if found_at:
-                try:
-                    return datetime.fromisoformat(found_at.replace('T', ' ').replace('Z', ''))
-                except:
-                    pass
+            story_id = article.story_id
+            if story_id and story_id in stories:
+                kept = stories[story_id]
+                copies = ({'source': article.source, 'link': article.link},) + article.also_reported_by
+                for copy in copies:
+                    if copy['link'] != kept.link and copy not in kept.also_reported_by:
+                        kept.add_copy(copy)
+                        copy_links.add(copy['link'])
+                continue
             
-            return datetime.min
+            if story_id:
+                stories[story_id] = article
+            copy_links.update(copy['link'] for copy in article.also_reported_by)
+            unique_articles.append(article)
         
-        unique_articles.sort(key=get_sort_date, reverse=True)
+        unique_articles.sort(key=lambda article: article.sort_timestamp, reverse=True)
         
-        limit = 100 if self.is_initial_scan else 50
-        unique_articles = unique_articles[:limit]
+        unique_articles = self.trim_history(unique_articles)
+        last_updated = datetime.now().isoformat()
         
-        with open('articles_data.json', 'w') as f:
+        with open(self.articles_file, 'w') as f:
             json.dump({
-                'last_updated': datetime.now().isoformat(),
+                'last_updated': last_updated,
                 'total_articles': len(unique_articles),
-                'articles': unique_articles
+                'articles': [article.to_dict() for article in unique_articles]
             }, f, indent=2)
+        write_binary(unique_articles, self.articles_binary_file)
+        self._articles = unique_articles
         
-        self.create_live_html(unique_articles)
+        with METRICS.timer('render'):
+            self.create_live_html(unique_articles, last_updated)
         return len(unique_articles)
     
-    def create_live_html(self, articles):
+    def trim_history(self, articles):
+        """Drop the oldest articles beyond history_limit, a whole page at a time.
+        
+        Archive pages are counted from the oldest end, so dropping whole pages
+        and moving oldest_page past them leaves every remaining page as it was.
+        """
+        excess = len(articles) - self.history_limit
+        if excess <= 0:
+            return articles
+        dropped_pages = -(-excess // self.articles_per_page)
+        self.oldest_page += dropped_pages
+        return articles[:max(len(articles) - dropped_pages * self.articles_per_page, 0)]
+    
+    def render_article_card(self, article, eager=False):
+        # A thumbnail evicted from the image cache changes the card, so it is part of the cache key
+        thumbnail = article.thumbnail
+        if thumbnail and os.path.exists(thumbnail['jpeg']):
+            self.image_cache.touch(thumbnail)
+        else:
+            thumbnail = None
+        card_key = (eager, thumbnail is not None)
+        if article.card_key == card_key:
+            return article.card_html
+        
+        article_link_escaped = article.link.replace("'", "\\'")
+        image_html = self.render_card_image(article, thumbnail, eager)
+        also_reported_html = ''
+        if article.also_reported_by:
+            also_reported_html = ' · Also on ' + ', '.join(
+                f'<a href="{copy["link"]}" class="source-link" target="_blank">{copy["source"]}</a>'
+                for copy in article.also_reported_by
+            )
+        
+        article.card_html = f'''
+<div class="article">
+    {image_html}
+    
+    <div class="article-content">
+        <div class="source-info">
+            <a href="{article.source_homepage}" class="source-link" target="_blank">{article.source}</a>{f' - {article.published_date}' if article.published_date else ''}{also_reported_html}
+        </div>
+        
+        <div class="title">{article.title}</div>
+        <div class="summary">{article.summary}</div>
+        
+        <a href="{article.link}" class="read-full-link" target="_blank">Read the full article here...</a>
+        
+        <div class="actions">
+            <div class="social-icons">
+                <button class="icon-btn like-btn" onclick="toggleLike(this)" title="Like">
+                    <svg width="16" height="16" fill="none" stroke="currentColor" stroke-width="2"><use href="#icon-like"/></svg>
+                    <span class="count">0</span>
+                </button>
+                <button class="icon-btn comment-btn" onclick="showComments()" title="Comment">
+                    <svg width="16" height="16" fill="none" stroke="currentColor" stroke-width="2"><use href="#icon-comment"/></svg>
+                    <span>0</span>
+                </button>
+                <button class="icon-btn share-btn" onclick="shareArticle('{article_link_escaped}')" title="Share">
+                    <svg width="16" height="16" fill="none" stroke="currentColor" stroke-width="2"><use href="#icon-share"/></svg>
+                </button>
+                <button class="icon-btn save-btn" onclick="saveArticle(this)" title="Save">
+                    <svg width="16" height="16" fill="none" stroke="currentColor" stroke-width="2"><use href="#icon-save"/></svg>
+                </button>
+            </div>
+        </div>
+    </div>
+</div>'''
+        article.card_key = card_key
+        return article.card_html
+    
+    def render_card_image(self, article, thumbnail, eager=False):
+        """Image markup for a card; thumbnail is the article's cached thumbnail if it is still on disk"""
+        loading = 'eager' if eager else 'lazy'
+        if thumbnail:
+            image_src = thumbnail['jpeg']
+        elif article.image_url:
+            image_src = article.image_url
+        else:
+            return ''
+        
+        img = f'<img src="{image_src}" alt="Article image" class="article-image" loading="{loading}" decoding="async" onerror="this.style.display=&quot;none&quot;">'
+        if thumbnail and thumbnail.get('webp'):
+            return f'<picture><source srcset="{thumbnail["webp"]}" type="image/webp">{img}</picture>'
+        return img
+    
+    def render_health_footer(self):
+        failing = self.health.unhealthy(self.feeds)
+        parts = [f'Sources: {len(self.feeds) - len(failing)} of {len(self.feeds)} healthy']
+        for source_name, state in failing:
+            if self.health.is_open(source_name):
+                retry_at = datetime.fromtimestamp(state['open_until']).strftime('%H:%M')
+                parts.append(f'{html.escape(source_name)} paused until {retry_at}')
+            else:
+                parts.append(f'{html.escape(source_name)} failing ({state["consecutive_failures"]} in a row)')
+        return '<footer class="source-health">' + ' · '.join(parts) + '</footer>'
+    
+    def refresh_health_footer(self):
+        """Rewrite the footer on the written pages if source health changed since they were rendered.
+        
+        Pages are otherwise only written when new articles are saved, so a
+        source going down or recovering in a quiet cycle would not show.
+        """
+        footer = self.render_health_footer()
+        if footer == self.rendered_health_footer:
+            return False
+        
+        for filename in [self.html_filename] + self.archive_page_files():
+            if not os.path.exists(filename):
+                continue
+            with open(filename, 'r') as f:
+                html_content = f.read()
+            with open(filename, 'w') as f:
+                f.write(HEALTH_FOOTER_RE.sub(lambda match: footer, html_content, count=1))
+        self.rendered_health_footer = footer
+        return True
+    
+    def page_filename(self, page_number):
+        return f'page-{page_number}.html'
+    
+    def archive_page_files(self):
+        """page-N.html files on disk, oldest first"""
+        numbers = [int(match.group(1)) for match in map(PAGE_FILE_RE.match, os.listdir('.')) if match]
+        return [self.page_filename(number) for number in sorted(numbers)]
+    
+    def create_live_html(self, articles, last_updated=None):
+        """Write the newest articles as index.html and older ones as page-N.html.
+        
+        Archive pages hold articles_per_page articles each, counted from the
+        oldest end and numbered up from oldest_page. New articles therefore
+        only ever land on index.html, and page-N.html keeps the same articles
+        from one save to the next, so infinite scroll neither repeats nor
+        skips cards. index.html takes everything newer than the archive,
+        between one and two pages' worth once there are that many.
+        """
+        last_updated = last_updated or datetime.now().isoformat()
+        per_page = self.articles_per_page
+        # The newest full page stays on index.html so it is never nearly empty
+        archived_pages = max(len(articles) // per_page - 1, 0)
+        front_count = len(articles) - archived_pages * per_page
+        footer = self.render_health_footer()
+        
+        written = set()
+        for i in range(archived_pages):
+            end = len(articles) - i * per_page
+            next_page = self.page_filename(self.oldest_page + i - 1) if i else None
+            html_content = self.render_page(articles[end - per_page:end], last_updated, footer, next_page)
+            filename = self.page_filename(self.oldest_page + i)
+            with open(filename, 'w') as f:
+                f.write(html_content)
+            written.add(filename)
+        
+        newest_page = self.page_filename(self.oldest_page + archived_pages - 1) if archived_pages else None
+        html_content = self.render_page(articles[:front_count], last_updated, footer, newest_page, front=True)
+        with open(self.html_filename, 'w') as f:
+            f.write(html_content)
+        
+        # Drop pages trimmed from the oldest end or left over from a longer list
+        for filename in self.archive_page_files():
+            if filename not in written:
+                os.remove(filename)
+        
+        self.rendered_health_footer = footer
+        
+        # Small file the page polls for updates instead of the full article data
+        with open(self.status_filename, 'w') as f:
+            json.dump({'last_updated': last_updated, 'total_articles': len(articles),
+                       'oldest_page': self.oldest_page}, f)
+    
+    def render_page(self, articles, last_updated, footer, next_page=None, front=False):
         html_content = f'''<!DOCTYPE html>
 <html><head>
 <title>Tottenham Hotspur</title>
@@ -673,6 +1145,16 @@ h1 {{
     background: #e3f2fd; 
 }}
 
+.next-page {{
+    display: block; text-align: center; margin: 20px auto;
+    color: #132257; font-weight: 500; text-decoration: none;
+}}
+
+.source-health {{
+    text-align: center; padding: 10px 15px 25px;
+    color: #666; font-size: 0.8em;
+}}
+
 @media (max-width: 480px) {{
     .main-content {{ 
         margin-top: 320px; 
@@ -714,6 +1196,23 @@ h1 {{
 </style>
 </head><body>
 
+<svg xmlns="http://www.w3.org/2000/svg" style="display: none;">
+    <symbol id="icon-like" viewBox="0 0 24 24">
+        <path d="M20.84 4.61a5.5 5.5 0 0 0-7.78 0L12 5.67l-1.06-1.06a5.5 5.5 0 0 0-7.78 7.78l1.06 1.06L12 21.23l7.78-7.78 1.06-1.06a5.5 5.5 0 0 0 0-7.78z"/>
+    </symbol>
+    <symbol id="icon-comment" viewBox="0 0 24 24">
+        <path d="M21 15a2 2 0 0 1-2 2H7l-4 4V5a2 2 0 0 1 2-2h14a2 2 0 0 1 2 2z"/>
+    </symbol>
+    <symbol id="icon-share" viewBox="0 0 24 24">
+        <path d="M4 12v8a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2v-8"/>
+        <polyline points="16,6 12,2 8,6"/>
+        <line x1="12" y1="2" x2="12" y2="15"/>
+    </symbol>
+    <symbol id="icon-save" viewBox="0 0 24 24">
+        <path d="M19 21l-7-5-7 5V5a2 2 0 0 1 2-2h10a2 2 0 0 1 2 2z"/>
+    </symbol>
+</svg>
+
 <div class="header">
     <div class="header-content">
         <h1>Tottenham Hotspur</h1>
@@ -732,65 +1231,39 @@ h1 {{
 <div class="main-content">
 <div id="articlesContainer">'''
 
-        for i, article in enumerate(articles, 1):
-            article_link_escaped = article['link'].replace("'", "\\'")
-            
-            html_content += f'''
-<div class="article">
-    {f'<img src="{article["image_url"]}" alt="Article image" class="article-image" onerror="this.style.display=&quot;none&quot;">' if article.get("image_url") else ''}
-    
-    <div class="article-content">
-        <div class="source-info">
-            <a href="{article.get('source_homepage', '#')}" class="source-link" target="_blank">{article['source']}</a>{f' - {article["published_date"]}' if article.get("published_date") else ''}
-        </div>
-        
-        <div class="title">{article['title']}</div>
-        <div class="summary">{article['summary']}</div>
+        for i, article in enumerate(articles):
+            # Only the first card is above the fold on the front page
+            html_content += self.render_article_card(article, eager=(front and i == 0))
         
-        <a href="{article['link']}" class="read-full-link" target="_blank">Read the full article here...</a>
+        next_page_html = ''
+        if next_page:
+            next_page_html = f'<a href="{next_page}" class="next-page" id="nextPage">Older stories</a>'
         
-        <div class="actions">
-            <div class="social-icons">
-                <button class="icon-btn like-btn" onclick="toggleLike(this)" title="Like">
-                    <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                        <path d="M20.84 4.61a5.5 5.5 0 0 0-7.78 0L12 5.67l-1.06-1.06a5.5 5.5 0 0 0-7.78 7.78l1.06 1.06L12 21.23l7.78-7.78 1.06-1.06a5.5 5.5 0 0 0 0-7.78z"/>
-                    </svg>
-                    <span class="count">0</span>
-                </button>
-                <button class="icon-btn comment-btn" onclick="showComments()" title="Comment">
-                    <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                        <path d="M21 15a2 2 0 0 1-2 2H7l-4 4V5a2 2 0 0 1 2-2h14a2 2 0 0 1 2 2z"/>
-                    </svg>
-                    <span>0</span>
-                </button>
-                <button class="icon-btn share-btn" onclick="shareArticle('{article_link_escaped}')" title="Share">
-                    <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                        <path d="M4 12v8a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2v-8"/>
-                        <polyline points="16,6 12,2 8,6"/>
-                        <line x1="12" y1="2" x2="12" y2="15"/>
-                    </svg>
-                </button>
-                <button class="icon-btn save-btn" onclick="saveArticle(this)" title="Save">
-                    <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                        <path d="M19 21l-7-5-7 5V5a2 2 0 0 1 2-2h10a2 2 0 0 1 2 2z"/>
-                    </svg>
-                </button>
-            </div>
-        </div>
-    </div>
-</div>'''
-
-        html_content += '''
+        html_content += f'''
 </div>
+{next_page_html}
 </div>
+{footer}
 
+<script>
+const PAGE_LAST_UPDATED = '{last_updated}';
+const STATUS_URL = '{self.status_filename}';
+</script>'''
+
+        html_content += '''
 <script>
 let updateInterval;
 let refreshInterval;
+let extraPagesLoaded = 0;
+let loadingNextPage = false;
 
 function startAutoUpdate() {
     updateInterval = setInterval(checkForUpdates, 30000);
     refreshInterval = setInterval(() => {
+        // Don't throw away older stories the reader has scrolled into
+        if (extraPagesLoaded > 0) {
+            return;
+        }
         console.log('Auto-refreshing page...');
         location.reload();
     }, 60000);
@@ -815,11 +1288,13 @@ function updateLastUpdatedTime() {
 }
 
 function checkForUpdates() {
-    fetch('articles_data.json?t=' + Date.now())
+    if (extraPagesLoaded > 0) {
+        return;
+    }
+    fetch(STATUS_URL + '?t=' + Date.now())
         .then(response => response.json())
         .then(data => {
-            const currentCount = document.querySelectorAll('.article').length;
-            if (data.total_articles > currentCount) {
+            if (data.last_updated !== PAGE_LAST_UPDATED) {
                 console.log('New articles found, refreshing...');
                 location.reload();
             }
@@ -893,93 +1368,190 @@ function manualRefresh() {
     }, 500);
 }
 
+function loadNextPage() {
+    const nextLink = document.getElementById('nextPage');
+    if (!nextLink || loadingNextPage) {
+        return;
+    }
+    loadingNextPage = true;
+    
+    fetch(nextLink.getAttribute('href'))
+        .then(response => response.text())
+        .then(html => {
+            const page = new DOMParser().parseFromString(html, 'text/html');
+            const container = document.getElementById('articlesContainer');
+            const shown = new Set(Array.from(container.querySelectorAll('.read-full-link'), link => link.href));
+            page.querySelectorAll('#articlesContainer .article').forEach(article => {
+                // A late story dated before newer ones can still shift a card onto the next page
+                const link = article.querySelector('.read-full-link');
+                if (!link || !shown.has(link.href)) {
+                    container.appendChild(document.adoptNode(article));
+                }
+            });
+            
+            const newNextLink = page.getElementById('nextPage');
+            if (newNextLink) {
+                nextLink.setAttribute('href', newNextLink.getAttribute('href'));
+            } else {
+                nextLink.remove();
+            }
+            extraPagesLoaded++;
+        })
+        .catch(err => {
+            console.log('Loading older stories failed:', err);
+        })
+        .finally(() => {
+            loadingNextPage = false;
+        });
+}
+
+function startInfiniteScroll() {
+    const nextLink = document.getElementById('nextPage');
+    if (!nextLink || !('IntersectionObserver' in window)) {
+        return;
+    }
+    const observer = new IntersectionObserver(entries => {
+        if (entries.some(entry => entry.isIntersecting)) {
+            loadNextPage();
+        }
+    }, { rootMargin: '600px' });
+    observer.observe(nextLink);
+}
+
 window.onload = function() {
     console.log('Page loaded, starting auto-update...');
     startAutoUpdate();
+    startInfiniteScroll();
 };
 </script>
 
 </body></html>'''
         
-        with open(self.html_filename, 'w') as f:
-            f.write(html_content)
+        return html_content
     
     def run_continuous(self):
+        cutoff = self.cutoff_date.strftime('%d %B %Y')
         print('🏆 TOTTENHAM LIVE NEWS SCANNER - SMART SUMMARIES')
         print('=' * 60)
         
         if self.is_initial_scan:
             print('🔄 INITIAL SCAN MODE - Deep historical search')
-            print('📅 Scanning deeper (25 items per feed) for June 1st+ articles')
+            print(f'📅 Scanning deeper ({self.initial_items_to_check} items per feed) for articles from {cutoff}')
         else:
             print('🔄 REGULAR SCAN MODE - Recent updates only')
-            print('📅 Filtering articles from 1st June 2025 onwards')
+            print(f'📅 Filtering articles from {cutoff} onwards')
         
         print('🎯 Real-time updates with smart summarization')
         print('📝 Smart keyword-based summaries from full articles')
         print('📱 Mobile-first design optimized for apps')
-        print('⏰ Checking every 1 minute for new articles')
+        print(f'⏰ Checking {len(self.feeds)} sources every {self.poll_interval}s for new articles')
         print('=' * 60)
         
         existing_articles = self.load_existing_articles()
         if not existing_articles:
             self.create_live_html([])
+        elif not len(self.search_index):
+            self.backfill_search_index(existing_articles)
+        
+        profiler = CycleProfiler()
+        profiler.install_signal_handler()
         
         while True:
             try:
                 scan_type = "DEEP HISTORICAL" if self.is_initial_scan else "REGULAR"
                 print(f'\n🕐 {datetime.now().strftime("%H:%M:%S")} - {scan_type} SCAN...')
                 
-                new_articles = self.check_for_articles()
+                with profiler.cycle():
+                    with METRICS.timer('check'):
+                        new_articles = self.check_for_articles()
+                    self.health.save()
+                    if not new_articles:
+                        self.refresh_health_footer()
                 
-                if new_articles:
-                    total_count = self.save_all_articles(new_articles)
-                    self.save_seen_articles()
+                    if new_articles:
+                        with METRICS.timer('save'):
+                            total_count = self.save_all_articles(new_articles)
+                        self.save_seen_articles()
+                        self.story_cache.save()
+                        self.work_queue.complete(self.get_article_id(article.link) for article in new_articles)
                     
-                    print(f'\n🎉 Added {len(new_articles)} new articles! Total: {total_count}')
-                    print(f'📱 Updated: {self.html_filename} (Mobile optimized)')
+                        print(f'\n🎉 Added {len(new_articles)} new articles! Total: {total_count}')
+                        print(f'📱 Updated: {self.html_filename} (Mobile optimized)')
                     
-                    for article in new_articles:
-                        date_info = f" ({article['published_date']})" if article.get('published_date') else ''
-                        image_info = ' 🖼️' if article.get('image_url') else ''
-                        summary_preview = article['summary'][:80] + '...' if len(article['summary']) > 80 else article['summary']
-                        print(f'   📰{image_info} {article["title"][:40]}...{date_info}')
-                        print(f'      📝 {summary_preview}')
+                        for article in new_articles:
+                            date_info = f' ({article.published_date})' if article.published_date else ''
+                            image_info = ' 🖼️' if article.image_url else ''
+                            summary_preview = article.summary[:80] + '...' if len(article.summary) > 80 else article.summary
+                            print(f'   📰{image_info} {article.title[:40]}...{date_info}')
+                            print(f'      📝 {summary_preview}')
                     
-                    if self.is_initial_scan:
-                        self.is_initial_scan = False
-                        print('\n🔄 Switching to regular scan mode for future updates')
-                else:
-                    print('   ℹ️  No new stories found (after June 1st cutoff)')
+                        if self.is_initial_scan:
+                            self.is_initial_scan = False
+                            print('\n🔄 Switching to regular scan mode for future updates')
+                    else:
+                        print(f'   ℹ️  No new stories found (after {cutoff} cutoff)')
                 
-                print(f'\n   😴 Sleeping 1 minute... (Open {self.html_filename} in browser)')
+                print(f'\n   😴 Sleeping {self.poll_interval}s... (Open {self.html_filename} in browser)')
                 print('-' * 60)
-                time.sleep(60)
+                time.sleep(self.poll_interval)
                 
             except KeyboardInterrupt:
                 print('\n🛑 Scanner stopped')
                 break
             except Exception as e:
                 print(f'❌ Error: {e}')
-                time.sleep(60)
-
-if __name__ == "__main__":
-    scanner = TottenhamAIScanner()
-    scanner.run_continuous()
+                time.sleep(self.poll_interval)
 
-# Add this at the very end of your file, after the main code:
 import http.server
 import socketserver
 import threading
+from urllib.parse import parse_qs
+
+class ScannerRequestHandler(http.server.SimpleHTTPRequestHandler):
+    def do_GET(self):
+        path, _, query_string = self.path.partition('?')
+        if path == '/metrics':
+            self.send_body(METRICS.render_prometheus().encode(), 'text/plain; version=0.0.4; charset=utf-8')
+            return
+        if path == '/search':
+            self.send_search(parse_qs(query_string))
+            return
+        super().do_GET()
+    
+    def send_search(self, params):
+        query = params.get('q', [''])[0]
+        try:
+            limit = int(params.get('limit', [DEFAULT_SEARCH_LIMIT])[0])
+        except ValueError:
+            limit = DEFAULT_SEARCH_LIMIT
+        sort = params.get('sort', ['newest'])[0]
+        search_index = SearchIndex()
+        try:
+            response = search_index.search_response(query, limit, sort)
+        finally:
+            search_index.close()
+        self.send_body(json.dumps(response).encode(), 'application/json; charset=utf-8')
+    
+    def send_body(self, body, content_type):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def end_headers(self):
+        # Thumbnails are content-hashed, so a given URL never changes
+        if self.path.startswith('/thumbs/'):
+            self.send_header('Cache-Control', 'public, max-age=31536000, immutable')
+        super().end_headers()
 
 def start_web_server():
     PORT = 8080
-    Handler = http.server.SimpleHTTPRequestHandler
+    Handler = ScannerRequestHandler
     with socketserver.TCPServer(("", PORT), Handler) as httpd:
         print(f"Web server running on port {PORT}")
         httpd.serve_forever()
 
-# Replace the last few lines with:
 if __name__ == "__main__":
     # Start web server in background
     web_thread = threading.Thread(target=start_web_server)
@@ -0,0 +1,403 @@
+"""Multi-worker mode: feeds sharded across scanner processes.
+
+One scanner checking a few hundred sources in turn cannot keep every feed
+within a minute of fresh. Here each worker process runs its own
+TottenhamAIScanner over a share of the sources and one aggregator builds
+the site from everything the workers find.
+
+Sources are assigned with a consistent hash ring over the live workers, so
+when a worker joins or stops heartbeating only the sources on its part of
+the ring move. Workers coordinate through one SQLite file: a shared seen
+table (an article is fetched once, whichever worker's feed lists it first),
+a published-articles table the aggregator drains, and worker heartbeats.
+Story fingerprints live in the shared store too, since syndicated copies
+come from different sources and so usually land on different workers.
+Thumbnails go to
+one shared directory, each worker keeping its own index of them, and only
+the aggregator evicts files to stay under the disk quota.
+
+    python workers.py worker worker-0
+    python workers.py aggregate
+    python workers.py run --workers 4
+    python workers.py run --workers 3 --fixtures fixtures/ --cycles 2 --interval 1
+
+run starts the workers as local processes and aggregates in the foreground.
+With --fixtures it replays recorded fixtures (see benchmark.py) from a local
+server instead of the live sites.
+"""
+import argparse
+import bisect
+import hashlib
+import json
+import multiprocessing
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+from article import Article
+from images import ImageCache
+from metrics import METRICS
+from story_cache import closest_story, fingerprint_bands, new_story, with_match_keys
+from tottenham_scanner import TottenhamAIScanner
+
+SHARED_DB_FILE = 'scanner_shared.db'
+RING_REPLICAS = 64
+# Heartbeats a worker may miss before its sources move to the others
+MISSED_HEARTBEATS = 3
+STORY_CACHE_ENTRIES = 2000
+STORY_COLUMNS = ('story_id', 'fingerprint', 'clauses', 'link', 'source', 'image_url', 'summary', 'found_at')
+
+def ring_hash(key):
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'big')
+
+class HashRing:
+    def __init__(self, nodes, replicas=RING_REPLICAS):
+        self.points = sorted((ring_hash(f'{node}#{i}'), node) for node in nodes for i in range(replicas))
+        self.hashes = [point for point, _ in self.points]
+
+    def node_for(self, key):
+        if not self.points:
+            return None
+        index = bisect.bisect(self.hashes, ring_hash(key)) % len(self.points)
+        return self.points[index][1]
+
+class SharedStore:
+    """SQLite file shared by the workers and the aggregator"""
+
+    def __init__(self, filename=SHARED_DB_FILE):
+        self.filename = filename
+        self.db = sqlite3.connect(filename, timeout=30)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.executescript('''
+            CREATE TABLE IF NOT EXISTS seen (
+                article_id TEXT PRIMARY KEY, title TEXT, found_at TEXT, worker TEXT);
+            CREATE TABLE IF NOT EXISTS articles (
+                link TEXT PRIMARY KEY, data TEXT NOT NULL, worker TEXT,
+                published INTEGER NOT NULL DEFAULT 0);
+            CREATE TABLE IF NOT EXISTS workers (
+                worker_id TEXT PRIMARY KEY, pid INTEGER, last_seen REAL);
+            CREATE TABLE IF NOT EXISTS health (
+                source TEXT PRIMARY KEY, state TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS stories (
+                story_id TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, clauses TEXT NOT NULL,
+                link TEXT, source TEXT, image_url TEXT, summary TEXT, found_at TEXT);
+            CREATE TABLE IF NOT EXISTS story_bands (
+                band INTEGER NOT NULL, value INTEGER NOT NULL, story_id TEXT NOT NULL);
+            CREATE INDEX IF NOT EXISTS story_bands_by_value ON story_bands (band, value);
+        ''')
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+    def heartbeat(self, worker_id, pid=None):
+        with self.db:
+            self.db.execute('INSERT OR REPLACE INTO workers VALUES (?, ?, ?)',
+                            (worker_id, pid or os.getpid(), time.time()))
+
+    def leave(self, worker_id):
+        with self.db:
+            self.db.execute('DELETE FROM workers WHERE worker_id = ?', (worker_id,))
+
+    def live_workers(self, stale_after):
+        rows = self.db.execute('SELECT worker_id FROM workers WHERE last_seen >= ?',
+                               (time.time() - stale_after,))
+        return sorted(worker_id for worker_id, in rows)
+
+    def is_seen(self, article_id):
+        return self.db.execute('SELECT 1 FROM seen WHERE article_id = ?', (article_id,)).fetchone() is not None
+
+    def mark_seen(self, article_id, info, worker_id=None):
+        with self.db:
+            self.db.execute('INSERT OR IGNORE INTO seen VALUES (?, ?, ?, ?)',
+                            (article_id, info.get('title'), info.get('found_at'), worker_id))
+
+    def import_seen(self, seen_articles):
+        """Carry over a single scanner's seen_articles.json when switching to workers"""
+        with self.db:
+            self.db.executemany('INSERT OR IGNORE INTO seen VALUES (?, ?, ?, NULL)', [
+                (article_id, info.get('title'), info.get('found_at'))
+                for article_id, info in seen_articles.items()
+            ])
+
+    def publish(self, articles, worker_id):
+        """Queue articles for the aggregator; a link already published by another worker is dropped"""
+        with self.db:
+            self.db.executemany('INSERT OR IGNORE INTO articles (link, data, worker) VALUES (?, ?, ?)', [
+                (article.link, json.dumps(article.to_dict()), worker_id) for article in articles
+            ])
+
+    def unpublished(self):
+        rows = self.db.execute('SELECT link, data FROM articles WHERE published = 0 ORDER BY rowid')
+        return [(link, json.loads(data)) for link, data in rows]
+
+    def mark_published(self, links):
+        with self.db:
+            self.db.executemany('UPDATE articles SET published = 1 WHERE link = ?', [(link,) for link in links])
+
+    def save_health(self, sources):
+        with self.db:
+            self.db.executemany('INSERT OR REPLACE INTO health VALUES (?, ?)', [
+                (source_name, json.dumps(state)) for source_name, state in sources.items()
+            ])
+
+    def load_health(self):
+        return {source_name: json.loads(state) for source_name, state in self.db.execute('SELECT * FROM health')}
+
+    def story_candidates(self, fingerprint):
+        """Stories sharing a fingerprint band with fingerprint, as story cache entries"""
+        candidates = {}
+        for band, value in fingerprint_bands(fingerprint):
+            rows = self.db.execute(
+                'SELECT s.* FROM story_bands b JOIN stories s USING (story_id) WHERE b.band = ? AND b.value = ?',
+                (band, value))
+            for row in rows:
+                candidates[row[0]] = dict(zip(STORY_COLUMNS, row))
+        return list(candidates.values())
+
+    def add_story(self, entry, max_entries):
+        """Store a story unless another worker stored a match first; returns the story kept"""
+        fingerprint = int(entry['fingerprint'], 16)
+        # Held from the re-check to the insert, so two workers cannot both add the same story
+        self.db.execute('BEGIN IMMEDIATE')
+        try:
+            candidates = [with_match_keys(candidate) for candidate in self.story_candidates(fingerprint)]
+            existing = closest_story(fingerprint, with_match_keys(dict(entry))['_clauses'], candidates)
+            if existing is not None:
+                self.db.commit()
+                return existing
+            self.db.execute(f'INSERT OR IGNORE INTO stories VALUES ({", ".join("?" * len(STORY_COLUMNS))})',
+                            [entry[column] for column in STORY_COLUMNS])
+            self.db.executemany('INSERT INTO story_bands VALUES (?, ?, ?)', [
+                (band, value, entry['story_id']) for band, value in fingerprint_bands(fingerprint)
+            ])
+            evicted = self.db.execute('DELETE FROM stories WHERE rowid <= (SELECT MAX(rowid) FROM stories) - ?',
+                                      (max_entries,)).rowcount
+            if evicted:
+                self.db.execute('DELETE FROM story_bands WHERE story_id NOT IN (SELECT story_id FROM stories)')
+            self.db.commit()
+        except:
+            self.db.rollback()
+            raise
+        return entry
+
+    def set_story_summary(self, story_id, summary):
+        with self.db:
+            self.db.execute('UPDATE stories SET summary = ? WHERE story_id = ?', (summary, story_id))
+
+class SharedStoryCache:
+    """Stands in for a scanner's StoryCache, backed by the shared store"""
+
+    def __init__(self, store, max_entries=STORY_CACHE_ENTRIES):
+        self.store = store
+        self.max_entries = max_entries
+        # Story id -> entry, so the pending copies of one cycle share the dict their summary is set on
+        self.entries = {}
+
+    def _entry(self, row):
+        entry = self.entries.setdefault(row['story_id'], {})
+        entry.update(row)
+        return with_match_keys(entry)
+
+    def lookup(self, fingerprint, clauses):
+        candidates = [self._entry(row) for row in self.store.story_candidates(fingerprint)]
+        best = closest_story(fingerprint, clauses, candidates)
+        METRICS.cache_lookup('story', best is not None)
+        return best
+
+    def add(self, fingerprint, clauses, link, source, image_url=None, summary=None):
+        entry = new_story(fingerprint, clauses, link, source, image_url, summary)
+        kept = self.store.add_story(entry, self.max_entries)
+        return self._entry({column: kept[column] for column in STORY_COLUMNS})
+
+    def set_summary(self, entry, summary):
+        entry['summary'] = summary
+        self.store.set_story_summary(entry['story_id'], summary)
+
+    def save(self):
+        # Every change is already in the shared store
+        pass
+
+class SharedSeenArticles:
+    """Stands in for a scanner's seen_articles dict, backed by the shared store"""
+
+    def __init__(self, store, worker_id):
+        self.store = store
+        self.worker_id = worker_id
+
+    def __contains__(self, article_id):
+        return self.store.is_seen(article_id)
+
+    def __setitem__(self, article_id, info):
+        self.store.mark_seen(article_id, info, self.worker_id)
+
+class Worker:
+    def __init__(self, worker_id, db_file=SHARED_DB_FILE, feed_urls=None, poll_interval=None, fast=False):
+        self.worker_id = worker_id
+        self.store = SharedStore(db_file)
+        self.scanner = TottenhamAIScanner()
+        self.store.import_seen(self.scanner.load_seen_articles())
+        self.scanner.seen_articles = SharedSeenArticles(self.store, worker_id)
+        # Syndicated copies usually come from sources on different workers, so stories are matched in the store
+        self.scanner.story_cache = SharedStoryCache(self.store)
+        # Thumbnail indexes are per worker, since several processes rewriting one JSON file would lose
+        # entries; the aggregator owns the quota so no worker evicts another's files
+        self.scanner.image_cache = ImageCache(quota_bytes=None, index_name=f'index_{worker_id}.json')
+        # Likewise for the work queue, or one worker would resume another's jobs
+        self.scanner.work_queue_file = f'work_queue_{worker_id}.db'
+        # Source health lives in the shared store so the aggregator can show it
+        self.scanner.health.sources = self.store.load_health()
+        if poll_interval:
+            self.scanner.poll_interval = poll_interval
+        if fast:
+            self.scanner.initial_request_delay = 0
+            self.scanner.request_delay = 0
+
+        self.all_feeds = dict(self.scanner.feeds)
+        if feed_urls:
+            self.all_feeds = {
+                name: dict(info, url=feed_urls[name])
+                for name, info in self.all_feeds.items() if name in feed_urls
+            }
+
+    def assigned_feeds(self):
+        stale_after = self.scanner.poll_interval * MISSED_HEARTBEATS
+        ring = HashRing(self.store.live_workers(stale_after) or [self.worker_id])
+        return {name: info for name, info in self.all_feeds.items() if ring.node_for(name) == self.worker_id}
+
+    def run_cycle(self):
+        self.store.heartbeat(self.worker_id)
+        self.scanner.feeds = self.assigned_feeds()
+        print(f'👷 {self.worker_id}: {len(self.scanner.feeds)} of {len(self.all_feeds)} sources')
+
+        new_articles = self.scanner.check_for_articles()
+        self.store.save_health({name: self.scanner.health.sources[name]
+                                for name in self.scanner.feeds if name in self.scanner.health.sources})
+        if new_articles:
+            self.store.publish(new_articles, self.worker_id)
+            self.scanner.story_cache.save()
+            self.scanner.work_queue.complete(self.scanner.get_article_id(article.link) for article in new_articles)
+            print(f'📤 {self.worker_id}: published {len(new_articles)} articles')
+        self.scanner.is_initial_scan = False
+        self.store.heartbeat(self.worker_id)
+
+    def run(self, cycles=None):
+        completed = 0
+        try:
+            while cycles is None or completed < cycles:
+                try:
+                    self.run_cycle()
+                except Exception as e:
+                    print(f'❌ {self.worker_id} error: {e}')
+                completed += 1
+                if cycles is None or completed < cycles:
+                    time.sleep(self.scanner.poll_interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.store.leave(self.worker_id)
+            self.store.close()
+
+class Aggregator:
+    """Publishes what the workers found through a single scanner's save path"""
+
+    def __init__(self, db_file=SHARED_DB_FILE):
+        self.store = SharedStore(db_file)
+        self.scanner = TottenhamAIScanner()
+
+    def publish_pending(self):
+        self.scanner.health.sources.update(self.store.load_health())
+        pending = self.store.unpublished()
+        if not pending:
+            self.scanner.refresh_health_footer()
+            return 0
+        total_count = self.scanner.save_all_articles([Article.from_dict(article) for _, article in pending])
+        self.store.mark_published([link for link, _ in pending])
+        # Rendering just touched every thumbnail on the site, so eviction takes the stalest files first
+        self.scanner.image_cache.enforce_quota()
+        print(f'🎉 {datetime.now().strftime("%H:%M:%S")} published {len(pending)} articles. Total: {total_count}')
+        return len(pending)
+
+    def run(self, interval=5, until=None):
+        """Publish every interval seconds, or until until() is true"""
+        existing_articles = self.scanner.load_existing_articles()
+        if not existing_articles:
+            self.scanner.create_live_html([])
+        try:
+            while True:
+                finished = until is not None and until()
+                self.publish_pending()
+                if finished:
+                    break
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print('\n🛑 Aggregator stopped')
+
+def run_worker(worker_id, db_file, cycles=None, feed_urls=None, poll_interval=None, fast=False):
+    Worker(worker_id, db_file, feed_urls, poll_interval, fast).run(cycles)
+
+def run_local(workers, db_file, fixtures_dir=None, cycles=None, poll_interval=None):
+    """Start workers as local processes and aggregate in this one"""
+    server = None
+    feed_urls = None
+    if fixtures_dir:
+        from benchmark import Fixtures, FixtureServer
+        server = FixtureServer(Fixtures(fixtures_dir)).start()
+        feed_urls = server.feed_urls
+
+    worker_ids = [f'worker-{i}' for i in range(workers)]
+    # Registering everyone up front stops the first worker to start from claiming every source
+    store = SharedStore(db_file)
+    for worker_id in worker_ids:
+        store.heartbeat(worker_id)
+    store.close()
+
+    processes = [
+        multiprocessing.Process(
+            target=run_worker, name=worker_id,
+            args=(worker_id, db_file, cycles, feed_urls, poll_interval, bool(fixtures_dir))
+        )
+        for worker_id in worker_ids
+    ]
+    for process in processes:
+        process.start()
+    try:
+        aggregator = Aggregator(db_file)
+        interval = min(5, poll_interval or 5)
+        aggregator.run(interval, until=lambda: not any(process.is_alive() for process in processes))
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+        if server:
+            server.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the scanner as sharded workers')
+    parser.add_argument('--db', default=SHARED_DB_FILE, help='shared SQLite store')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    worker_parser = subparsers.add_parser('worker', help='scan this worker\'s share of the sources')
+    worker_parser.add_argument('worker_id')
+    worker_parser.add_argument('--cycles', type=int, default=None)
+
+    subparsers.add_parser('aggregate', help='publish what the workers found')
+
+    run_parser = subparsers.add_parser('run', help='start local workers and an aggregator')
+    run_parser.add_argument('--workers', type=int, default=multiprocessing.cpu_count())
+    run_parser.add_argument('--fixtures', help='replay fixtures recorded by benchmark.py instead of the live sites')
+    run_parser.add_argument('--cycles', type=int, default=None, help='stop after this many cycles per worker')
+    run_parser.add_argument('--interval', type=float, default=None, help='seconds between cycles')
+
+    args = parser.parse_args()
+    if args.command == 'worker':
+        run_worker(args.worker_id, args.db, args.cycles)
+    elif args.command == 'aggregate':
+        Aggregator(args.db).run()
+    else:
+        run_local(args.workers, args.db, args.fixtures, args.cycles, args.interval)
+
+if __name__ == '__main__':
+    main()
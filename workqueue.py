@@ -0,0 +1,101 @@
+"""Durable per-article work queue with checkpoints.
+
+seen_articles.json and articles_data.json are only written once a whole
+cycle has finished, so a crash or restart mid-cycle used to lose every
+article fetched and summarised so far and fetch them all again. Each
+accepted feed item is now recorded here as a job and checkpointed after
+every step:
+
+    queued      accepted from the feed, article page not fetched yet
+    extracted   page fetched and parsed, text and thumbnail known
+    summarised  article record complete, waiting to be saved
+
+Jobs are deleted once the cycle's articles have been saved. On start-up
+the scanner resumes whatever is left from the step after its last
+checkpoint, and feed items that still have a job are not accepted again.
+
+Every resume counts as an attempt. A job that is still unfinished after
+MAX_ATTEMPTS, because it raises or because the scanner dies while working
+on it, is marked failed and kept for inspection instead of being resumed
+ahead of the feeds forever.
+"""
+import json
+import sqlite3
+from datetime import datetime
+
+WORK_QUEUE_FILE = 'work_queue.db'
+STATES = ('queued', 'extracted', 'summarised')
+MAX_ATTEMPTS = 3
+
+class WorkQueue:
+    def __init__(self, filename=WORK_QUEUE_FILE):
+        self.filename = filename
+        self.db = sqlite3.connect(filename, timeout=30)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        # A checkpoint lost to a power cut only means one step is redone
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.execute('''
+            CREATE TABLE IF NOT EXISTS jobs (
+                article_id TEXT PRIMARY KEY,
+                state TEXT NOT NULL,
+                data TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT)
+        ''')
+        # Queues created before attempts were counted
+        columns = [row[1] for row in self.db.execute('PRAGMA table_info(jobs)')]
+        if 'attempts' not in columns:
+            self.db.execute('ALTER TABLE jobs ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0')
+            self.db.execute('ALTER TABLE jobs ADD COLUMN last_error TEXT')
+        self.db.commit()
+
+    def __contains__(self, article_id):
+        return self.db.execute('SELECT 1 FROM jobs WHERE article_id = ?', (article_id,)).fetchone() is not None
+
+    def __len__(self):
+        return self.db.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+
+    def add(self, article_id, job):
+        with self.db:
+            self.db.execute('INSERT OR IGNORE INTO jobs (article_id, state, data, updated_at) VALUES (?, ?, ?, ?)',
+                            (article_id, 'queued', json.dumps(job), datetime.now().isoformat()))
+
+    def checkpoint(self, article_id, state, job):
+        if state not in STATES:
+            raise ValueError('Unknown job state: ' + state)
+        with self.db:
+            self.db.execute('UPDATE jobs SET state = ?, data = ?, updated_at = ? WHERE article_id = ?',
+                            (state, json.dumps(job), datetime.now().isoformat(), article_id))
+
+    def unfinished(self):
+        """(article_id, state, job) for every job left that has not failed, oldest first"""
+        rows = self.db.execute("SELECT article_id, state, data FROM jobs WHERE state != 'failed' ORDER BY rowid")
+        return [(article_id, state, json.loads(data)) for article_id, state, data in rows]
+
+    def start_attempt(self, article_id):
+        """Count another attempt at a resumed job; returns how many there have been"""
+        with self.db:
+            self.db.execute('UPDATE jobs SET attempts = attempts + 1 WHERE article_id = ?', (article_id,))
+        row = self.db.execute('SELECT attempts FROM jobs WHERE article_id = ?', (article_id,)).fetchone()
+        return row[0] if row else 0
+
+    def record_error(self, article_id, error, attempt):
+        """Note why an attempt failed, giving up on the job after MAX_ATTEMPTS; returns True if it did"""
+        given_up = attempt >= MAX_ATTEMPTS
+        with self.db:
+            self.db.execute('UPDATE jobs SET state = COALESCE(?, state), last_error = ?, updated_at = ? WHERE article_id = ?',
+                            ('failed' if given_up else None, str(error)[:200], datetime.now().isoformat(), article_id))
+        return given_up
+
+    def failed(self):
+        """(article_id, job, last_error) for jobs given up on"""
+        rows = self.db.execute("SELECT article_id, data, last_error FROM jobs WHERE state = 'failed' ORDER BY rowid")
+        return [(article_id, json.loads(data), last_error) for article_id, data, last_error in rows]
+
+    def complete(self, article_ids):
+        with self.db:
+            self.db.executemany('DELETE FROM jobs WHERE article_id = ?', [(article_id,) for article_id in article_ids])
+
+    def close(self):
+        self.db.close()